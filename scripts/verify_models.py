@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import importlib
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -20,18 +20,16 @@ CHECKS = {
 }
 
 
-def _import_optional(name: str) -> tuple[bool, str]:
-    module_name = name
-    pip_name = name
+def _module_name(name: str) -> str:
     if name == "opencv-python":
-        module_name = "cv2"
-    if name == "torch":
-        pip_name = "torch"
-    try:
-        importlib.import_module(module_name)
-        return True, module_name
-    except ImportError:
-        return False, pip_name
+        return "cv2"
+    return name
+
+
+def _scan_modules() -> dict[str, bool]:
+    """Check every module named in CHECKS once; find_spec locates it without executing it."""
+    all_modules = {module for meta in CHECKS.values() for module in meta["modules"]}
+    return {module: importlib.util.find_spec(_module_name(module)) is not None for module in all_modules}
 
 
 def _check_path(path: Path, path_type: str) -> bool:
@@ -51,6 +49,7 @@ def run_checks() -> int:
     settings = load_settings()
     status_lines: list[str] = []
     ok = True
+    available_modules = _scan_modules()
 
     esrgan = settings.models.esrgan
     sdxl = settings.models.sdxl
@@ -66,11 +65,7 @@ def run_checks() -> int:
         if not exists:
             ok = False
 
-        missing_modules: list[str] = []
-        for module in meta["modules"]:
-            available, pip_name = _import_optional(module)
-            if not available:
-                missing_modules.append(pip_name)
+        missing_modules = [module for module in meta["modules"] if not available_modules[module]]
         if missing_modules:
             ok = False
             status_lines.append(f"[{label}] Fehlende Pakete: {', '.join(sorted(set(missing_modules)))}")
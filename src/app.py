@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 
@@ -12,14 +13,19 @@ from .core.settings import load_settings
 from .ui.main_window import MainWindow
 
 
+@functools.lru_cache(maxsize=1)
 def _load_stylesheet() -> str:
     theme_path = Path(__file__).parent / "ui" / "themes" / "titica_bootstrap.qss"
-    if not theme_path.exists():
+    try:
+        with open(theme_path, "rb") as fh:
+            return fh.read().decode("utf-8")
+    except FileNotFoundError:
         return ""
-    return theme_path.read_text(encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_icon() -> QIcon | None:
+    # Only call once a QApplication exists; QIcon needs it to decode the PNG.
     icon_path = Path(__file__).resolve().parents[1] / "image_processor.png"
     if icon_path.exists():
         return QIcon(str(icon_path))
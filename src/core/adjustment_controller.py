@@ -44,31 +44,31 @@ class AdjustmentController:
 
     def update_factor(self, field: str, value: float) -> None:
         if field == "brightness":
-            set_brightness(self._state, value)
+            self._state = set_brightness(self._state, value)
         elif field == "contrast":
-            set_contrast(self._state, value)
+            self._state = set_contrast(self._state, value)
         elif field == "saturation":
-            set_saturation(self._state, value)
+            self._state = set_saturation(self._state, value)
         elif field == "sharpness":
-            set_sharpness(self._state, value)
+            self._state = set_sharpness(self._state, value)
         else:
             raise AdjustmentControllerError(f"Unbekanntes Feld: {field}")
         self._emit()
 
     def update_temperature(self, value: int) -> None:
-        set_temperature(self._state, value)
+        self._state = set_temperature(self._state, value)
         self._emit()
 
     def update_red_balance(self, value: int) -> None:
-        set_red_balance(self._state, value)
+        self._state = set_red_balance(self._state, value)
         self._emit()
 
     def update_green_balance(self, value: int) -> None:
-        set_green_balance(self._state, value)
+        self._state = set_green_balance(self._state, value)
         self._emit()
 
     def update_blue_balance(self, value: int) -> None:
-        set_blue_balance(self._state, value)
+        self._state = set_blue_balance(self._state, value)
         self._emit()
 
     def _emit(self) -> None:
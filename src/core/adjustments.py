@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 
+import cv2
 import numpy as np
 from PIL import Image, ImageEnhance, ImageOps
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
-@dataclass
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+_PERCENTILE_STRIDE = 4
+_RESULT_CACHE_SIZE = 4
+# Set when the Numba kernel fails to compile; saturation then stays on the cv2 path.
+_numba_failed = False
+
+
+@dataclass(frozen=True, slots=True)
 class AdjustmentState:
     brightness: float = 1.0
     contrast: float = 1.0
@@ -17,60 +32,229 @@ class AdjustmentState:
     green_balance: int = 0  # -100 .. 100
     blue_balance: int = 0  # -100 .. 100
 
+    def is_identity(self) -> bool:
+        return (
+            self.brightness == 1.0
+            and self.contrast == 1.0
+            and self.saturation == 1.0
+            and self.sharpness == 1.0
+            and self.temperature == 0
+            and self.red_balance == 0
+            and self.green_balance == 0
+            and self.blue_balance == 0
+        )
+
 
 def _clamp_factor(value: float, minimum: float = 0.2, maximum: float = 3.0) -> float:
     return float(max(minimum, min(maximum, value)))
 
 
-def set_brightness(state: AdjustmentState, value: float) -> None:
-    state.brightness = _clamp_factor(value)
+def set_brightness(state: AdjustmentState, value: float) -> AdjustmentState:
+    return replace(state, brightness=_clamp_factor(value))
+
+
+def set_contrast(state: AdjustmentState, value: float) -> AdjustmentState:
+    return replace(state, contrast=_clamp_factor(value))
 
 
-def set_contrast(state: AdjustmentState, value: float) -> None:
-    state.contrast = _clamp_factor(value)
+def set_saturation(state: AdjustmentState, value: float) -> AdjustmentState:
+    return replace(state, saturation=_clamp_factor(value))
 
 
-def set_saturation(state: AdjustmentState, value: float) -> None:
-    state.saturation = _clamp_factor(value)
+def set_sharpness(state: AdjustmentState, value: float) -> AdjustmentState:
+    return replace(state, sharpness=_clamp_factor(value))
 
 
-def set_sharpness(state: AdjustmentState, value: float) -> None:
-    state.sharpness = _clamp_factor(value)
+def set_temperature(state: AdjustmentState, value: int) -> AdjustmentState:
+    return replace(state, temperature=int(max(-100, min(100, value))))
 
 
-def set_temperature(state: AdjustmentState, value: int) -> None:
-    state.temperature = int(max(-100, min(100, value)))
+def set_red_balance(state: AdjustmentState, value: int) -> AdjustmentState:
+    return replace(state, red_balance=int(max(-100, min(100, value))))
 
 
-def set_red_balance(state: AdjustmentState, value: int) -> None:
-    state.red_balance = int(max(-100, min(100, value)))
+def set_green_balance(state: AdjustmentState, value: int) -> AdjustmentState:
+    return replace(state, green_balance=int(max(-100, min(100, value))))
 
 
-def set_green_balance(state: AdjustmentState, value: int) -> None:
-    state.green_balance = int(max(-100, min(100, value)))
+def set_blue_balance(state: AdjustmentState, value: int) -> AdjustmentState:
+    return replace(state, blue_balance=int(max(-100, min(100, value))))
 
 
-def set_blue_balance(state: AdjustmentState, value: int) -> None:
-    state.blue_balance = int(max(-100, min(100, value)))
+# (id(source), state) -> (weakref to source, result). The weakref drops the entry once the
+# source image is garbage collected, so a recycled id() can never return a stale result.
+_result_cache: OrderedDict[tuple[int, AdjustmentState], tuple[weakref.ref, Image.Image]] = OrderedDict()
 
 
 def apply_adjustments(image: Image.Image, state: AdjustmentState) -> Image.Image:
+    if state.is_identity() and image.mode == "RGB":
+        return image
+
+    key = (id(image), state)
+    cached = _result_cache.get(key)
+    if cached is not None:
+        _result_cache.move_to_end(key)
+        return cached[1]
+
+    result = _apply_adjustments_uncached(image, state)
+    _result_cache[key] = (weakref.ref(image, lambda _ref, key=key: _result_cache.pop(key, None)), result)
+    if len(_result_cache) > _RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return result
+
+
+def _apply_adjustments_uncached(image: Image.Image, state: AdjustmentState) -> Image.Image:
+    """
+    Brightness, contrast, saturation, sharpness, temperature, RGB balance, clipped after each step.
+
+    Same stages and clip points as the ImageEnhance chain. The per-channel steps are lookup tables,
+    and tables that meet without a cross-channel step in between run as one ``point`` pass.
+    """
     result = image.convert("RGB")
 
-    if state.brightness != 1.0:
-        result = ImageEnhance.Brightness(result).enhance(state.brightness)
+    luts = _tone_luts(result, state)
+    if state.saturation != 1.0 or state.sharpness != 1.0:
+        if luts is not None:
+            result = _apply_luts(result, luts)
+            luts = None
+        if state.saturation != 1.0:
+            result = _apply_saturation(result, state.saturation)
+        if state.sharpness != 1.0:
+            result = ImageEnhance.Sharpness(result).enhance(state.sharpness)
+
+    gain_luts = _gain_luts(state)
+    if gain_luts is not None:
+        luts = gain_luts if luts is None else np.take_along_axis(gain_luts, luts.astype(np.intp), axis=1)
+    if luts is not None:
+        result = _apply_luts(result, luts)
+
+    return result
+
+
+def _tone_luts(image: Image.Image, state: AdjustmentState) -> np.ndarray | None:
+    """
+    Brightness then contrast as one (3, 256) table, or None when both are neutral.
+
+    Contrast pivots around the mean luminance of the brightened and clipped image, like
+    ``ImageEnhance.Contrast`` applied after ``ImageEnhance.Brightness``. The mean is linear in
+    the channels, so it comes from the channel histograms mapped through the brightness table.
+    """
+    if state.brightness == 1.0 and state.contrast == 1.0:
+        return None
+    levels = np.arange(256, dtype=np.float32)
+    luts = np.tile(_clip_levels(levels * np.float32(state.brightness)), (3, 1))
     if state.contrast != 1.0:
-        result = ImageEnhance.Contrast(result).enhance(state.contrast)
-    if state.saturation != 1.0:
-        result = ImageEnhance.Color(result).enhance(state.saturation)
-    if state.sharpness != 1.0:
-        result = ImageEnhance.Sharpness(result).enhance(state.sharpness)
+        hist = np.asarray(image.histogram(), dtype=np.float64).reshape(3, 256)
+        channel_means = (hist * luts).sum(axis=1) / max(1.0, hist[0].sum())
+        mean = np.float32(int(float(_LUMA_WEIGHTS @ channel_means) + 0.5))
+        # Blend order of ImageEnhance: degenerate + factor * (image - degenerate)
+        luts = _clip_levels(mean + np.float32(state.contrast) * (luts - mean))
+    return luts
+
+
+def _gain_luts(state: AdjustmentState) -> np.ndarray | None:
+    """Temperature then RGB balance as one (3, 256) table, each step clipped; None when neutral."""
+    balance = (state.red_balance, state.green_balance, state.blue_balance)
+    if state.temperature == 0 and not any(balance):
+        return None
+    luts = np.tile(np.arange(256, dtype=np.float32), (3, 1))
     if state.temperature != 0:
-        result = _apply_temperature(result, state.temperature)
-    if state.red_balance != 0 or state.green_balance != 0 or state.blue_balance != 0:
-        result = _apply_rgb_balance(result, state.red_balance, state.green_balance, state.blue_balance)
+        factor = (state.temperature / 100.0) * 0.4  # moderate adjustment
+        gains = np.array([1.0 + factor, 1.0, 1.0 - factor], dtype=np.float32)
+        luts = _clip_levels(luts * gains[:, None])
+    if any(balance):
+        # -100..100 to gain factors 0.6..1.4
+        gains = np.array([1.0 + (value / 100.0) * 0.4 for value in balance], dtype=np.float32)
+        luts = _clip_levels(luts * gains[:, None])
+    return luts
 
-    return result
+
+def _clip_levels(values: np.ndarray) -> np.ndarray:
+    """
+    Clip to 0..255 and truncate to whole levels (kept as float for chaining tables).
+
+    Truncating float32 results is what Pillow's blend does, so the tables reproduce ImageEnhance.
+    """
+    return np.floor(np.clip(values, 0, 255))
+
+
+def _apply_luts(image: Image.Image, luts: np.ndarray) -> Image.Image:
+    """Map every channel through its own 256-entry lookup table inside Pillow (no NumPy copy of the image)."""
+    # An RGB image takes one concatenated 768-entry table: R, then G, then B.
+    return image.point(luts.astype(np.uint8).ravel().tolist())
+
+
+def _apply_saturation(image: Image.Image, saturation: float) -> Image.Image:
+    """Blend towards luminance (same weights as ImageEnhance.Color) as one colour-matrix pass."""
+    matrix = saturation * np.eye(3, dtype=np.float32)
+    matrix += (1.0 - saturation) * _LUMA_WEIGHTS[:, None]
+    offset = np.zeros(3, dtype=np.float32)
+
+    global _numba_failed
+    # One writable uint8 copy of the image; both kernels write their clipped result back into it.
+    # Both round to the nearest level: grey pixels come out at v +- epsilon, which truncation
+    # would turn into v - 1 on some machines and not on others.
+    buffer = np.array(image)
+    if HAS_NUMBA and not _numba_failed:
+        try:
+            _affine_kernel(buffer, matrix, offset, buffer)
+        except Exception:
+            # Compilation happens on the first call and leaves the buffer untouched if it fails.
+            _numba_failed = True
+        else:
+            return Image.fromarray(buffer, "RGB")
+    # cv2.transform expects the matrix per output channel plus an offset column. Its uint8 path
+    # uses fixed-point weights and can land one level off, so it runs on float32 here and rounds
+    # exactly like the kernel.
+    result = cv2.transform(buffer.astype(np.float32), np.column_stack([matrix.T, offset + 0.5]))
+    np.clip(result, 0, 255, out=result)
+    buffer[...] = result
+    return Image.fromarray(buffer, "RGB")
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True)
+    def _affine_kernel(src, matrix, offset, dst):  # pragma: no cover - compiled
+        """uint8 -> uint8 colour matrix, rows spread across cores; ``dst`` may alias ``src``."""
+        height, width, _ = src.shape
+        for y in prange(height):
+            for x in range(width):
+                r = np.float32(src[y, x, 0])
+                g = np.float32(src[y, x, 1])
+                b = np.float32(src[y, x, 2])
+                for c in range(3):
+                    # +0.5 and truncate: round to the nearest level, same as the cv2 fallback
+                    v = r * matrix[0, c] + g * matrix[1, c] + b * matrix[2, c] + offset[c] + np.float32(0.5)
+                    dst[y, x, c] = 0 if v < 0 else (255 if v >= 255 else np.uint8(v))
+
+
+def _channel_histograms(image: Image.Image) -> np.ndarray:
+    """
+    Return a 256-bin histogram per RGB channel, shape ``(3, 256)``.
+
+    Only every 4th pixel per axis is counted; percentile estimates are stable on the subsample.
+    The subsample is taken by PIL before anything reaches NumPy, so the full frame is never copied.
+    """
+    size = (max(1, image.width // _PERCENTILE_STRIDE), max(1, image.height // _PERCENTILE_STRIDE))
+    sample = image.resize(size, Image.Resampling.NEAREST)
+    if sample.mode != "RGB":
+        sample = sample.convert("RGB")
+    return np.asarray(sample.histogram()).reshape(3, 256)
+
+
+def _histogram_percentiles(hist: np.ndarray, percents: list[float]) -> np.ndarray:
+    """Look up percentiles (0..100) of uint8 data from its histogram via the cumulative sum."""
+    cumulative = np.cumsum(hist)
+    return np.searchsorted(cumulative, np.asarray(percents) / 100.0 * cumulative[-1])
+
+
+def _histogram_median(hist: np.ndarray) -> float:
+    """Exact median of uint8 data from its histogram, averaging the middle pair like ``np.median``."""
+    cumulative = np.cumsum(hist)
+    total = int(cumulative[-1])
+    lower, upper = np.searchsorted(cumulative, [(total - 1) // 2, total // 2], side="right")
+    return (int(lower) + int(upper)) / 2.0
 
 
 def calculate_auto_balance_photoshop_style(image: Image.Image) -> AdjustmentState:
@@ -78,8 +262,7 @@ def calculate_auto_balance_photoshop_style(image: Image.Image) -> AdjustmentStat
     Photoshop-style auto balance using histogram clipping.
     Clips darkest 2% and brightest 2% per channel, then stretches.
     """
-    rgb_image = image.convert("RGB")
-    arr = np.array(rgb_image, dtype=np.float32)
+    hist = _channel_histograms(image)
 
     brightness = 1.0
     contrast = 1.0
@@ -87,37 +270,31 @@ def calculate_auto_balance_photoshop_style(image: Image.Image) -> AdjustmentStat
     g_balance = 0
     b_balance = 0
 
-    # Analyze each channel
-    for ch_idx, (r_ch, g_ch, b_ch) in enumerate([(arr[..., 0], 0, 0), (arr[..., 1], 1, 1), (arr[..., 2], 2, 2)]):
-        if ch_idx > 0:
-            continue  # Only do overall analysis once
-
-        # Find 2nd and 98th percentile for full image
-        p2 = np.percentile(arr, 2)
-        p98 = np.percentile(arr, 98)
-
-        # Calculate how much to stretch
-        current_range = p98 - p2
-        if current_range > 10:  # Avoid division by zero
-            # How much of the full range (0-255) is used?
-            used_ratio = current_range / 255.0
-
-            # If less than 85% of range is used, stretch it (more aggressive)
-            if used_ratio < 0.85:
-                # Contrast boost to stretch histogram
-                contrast = 1.0 / used_ratio
-                contrast = np.clip(contrast, 1.0, 1.5)  # Max 50% increase
-
-                # Brightness adjustment to re-center
-                target_mid = 127.5
-                current_mid = (p2 + p98) / 2.0
-                brightness = target_mid / current_mid if current_mid > 10 else 1.0
-                brightness = np.clip(brightness, 0.75, 1.35)  # Max ±25-35%
+    # Overall analysis: 2nd and 98th percentile across all channels
+    p2, p98 = _histogram_percentiles(hist.sum(axis=0), [2, 98])
+
+    # Calculate how much to stretch
+    current_range = p98 - p2
+    if current_range > 10:  # Avoid division by zero
+        # How much of the full range (0-255) is used?
+        used_ratio = current_range / 255.0
+
+        # If less than 85% of range is used, stretch it (more aggressive)
+        if used_ratio < 0.85:
+            # Contrast boost to stretch histogram
+            contrast = 1.0 / used_ratio
+            contrast = np.clip(contrast, 1.0, 1.5)  # Max 50% increase
+
+            # Brightness adjustment to re-center
+            target_mid = 127.5
+            current_mid = (p2 + p98) / 2.0
+            brightness = target_mid / current_mid if current_mid > 10 else 1.0
+            brightness = np.clip(brightness, 0.75, 1.35)  # Max ±25-35%
 
     # Color balance per channel
-    r_p2, r_p98 = np.percentile(arr[..., 0], 2), np.percentile(arr[..., 0], 98)
-    g_p2, g_p98 = np.percentile(arr[..., 1], 2), np.percentile(arr[..., 1], 98)
-    b_p2, b_p98 = np.percentile(arr[..., 2], 2), np.percentile(arr[..., 2], 98)
+    r_p2, r_p98 = _histogram_percentiles(hist[0], [2, 98])
+    g_p2, g_p98 = _histogram_percentiles(hist[1], [2, 98])
+    b_p2, b_p98 = _histogram_percentiles(hist[2], [2, 98])
 
     r_mid = (r_p2 + r_p98) / 2.0
     g_mid = (g_p2 + g_p98) / 2.0
@@ -146,15 +323,13 @@ def calculate_auto_balance_conservative(image: Image.Image) -> AdjustmentState:
     Conservative auto balance: only adjust if histogram is clearly compressed.
     Maximum adjustment: ±20-30%
     """
-    rgb_image = image.convert("RGB")
-    arr = np.array(rgb_image, dtype=np.float32)
+    hist = _channel_histograms(image)
 
     brightness = 1.0
     contrast = 1.0
 
     # Check if histogram is compressed
-    p5 = np.percentile(arr, 5)
-    p95 = np.percentile(arr, 95)
+    p5, p95 = _histogram_percentiles(hist.sum(axis=0), [5, 95])
     current_range = p95 - p5
 
     # Only adjust if not using full range (threshold erhöht von 180 auf 210)
@@ -186,13 +361,13 @@ def calculate_auto_balance_color_only(image: Image.Image) -> AdjustmentState:
     Color balance only: adjust RGB channels to neutralize color casts.
     No brightness or contrast changes.
     """
-    rgb_image = image.convert("RGB")
-    arr = np.array(rgb_image, dtype=np.float32)
+    # Full-frame bincount per channel (PIL counts every pixel without a NumPy copy of the image).
+    # The medians feed a 1.5% threshold directly, so the subsampled histograms are not used here.
+    rgb_image = image if image.mode == "RGB" else image.convert("RGB")
+    hist = np.asarray(rgb_image.histogram()).reshape(3, 256)
 
     # Use median instead of mean to avoid outlier influence
-    r_median = np.median(arr[..., 0])
-    g_median = np.median(arr[..., 1])
-    b_median = np.median(arr[..., 2])
+    r_median, g_median, b_median = (_histogram_median(channel) for channel in hist)
 
     avg_median = (r_median + g_median + b_median) / 3.0
 
@@ -225,28 +400,3 @@ def calculate_auto_balance_color_only(image: Image.Image) -> AdjustmentState:
         blue_balance=b_balance,
     )
 
-
-def _apply_temperature(image: Image.Image, shift: int) -> Image.Image:
-    arr = np.array(image, dtype=np.float32)
-    factor = (shift / 100.0) * 0.4  # moderate adjustment
-    r_gain = 1.0 + factor
-    b_gain = 1.0 - factor
-    arr[..., 0] = np.clip(arr[..., 0] * r_gain, 0, 255)
-    arr[..., 2] = np.clip(arr[..., 2] * b_gain, 0, 255)
-    return Image.fromarray(arr.astype(np.uint8), "RGB")
-
-
-def _apply_rgb_balance(image: Image.Image, red: int, green: int, blue: int) -> Image.Image:
-    """Apply individual RGB channel adjustments (-100 to +100)."""
-    arr = np.array(image, dtype=np.float32)
-
-    # Convert -100..100 to gain factors (0.6 to 1.4 range)
-    r_gain = 1.0 + (red / 100.0) * 0.4
-    g_gain = 1.0 + (green / 100.0) * 0.4
-    b_gain = 1.0 + (blue / 100.0) * 0.4
-
-    arr[..., 0] = np.clip(arr[..., 0] * r_gain, 0, 255)
-    arr[..., 1] = np.clip(arr[..., 1] * g_gain, 0, 255)
-    arr[..., 2] = np.clip(arr[..., 2] * b_gain, 0, 255)
-
-    return Image.fromarray(arr.astype(np.uint8), "RGB")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Optional, Tuple
 
 
@@ -19,7 +20,7 @@ def _rect_intersection(a: RectTuple, b: RectTuple) -> RectTuple:
     return (x1, y1, width, height)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CropGeometry:
     selection: RectTuple
     image_bounds: RectTuple
@@ -31,11 +32,13 @@ class CropGeometry:
             max(1, int(round(self.selection[3]))),
         )
 
+    @cached_property
     def intersection(self) -> RectTuple:
+        # Frozen fields make this safe to compute once; cached_property writes to __dict__ directly.
         return _rect_intersection(self.selection, self.image_bounds)
 
     def has_whitespace(self) -> bool:
-        inter = self.intersection()
+        inter = self.intersection
         epsilon = 0.25
         return inter[2] < self.selection[2] - epsilon or inter[3] < self.selection[3] - epsilon
 
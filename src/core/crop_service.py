@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from PySide6.QtCore import QRectF
-from PySide6.QtGui import QPixmap
-from PIL import Image, ImageQt
+from PySide6.QtCore import QRect, QRectF
+from PySide6.QtGui import QImage, QPixmap
+from PIL import Image
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CropResult:
     box: tuple[int, int, int, int]
 
@@ -51,9 +51,15 @@ def compute_crop_box(
 def perform_crop(pixmap: QPixmap, crop: CropResult) -> Image.Image:
     if pixmap.isNull():
         raise CropServiceError("Kein Bild geladen.")
-    qimage = pixmap.toImage()
-    pil_image = ImageQt.fromqimage(qimage)  # type: ignore[arg-type]
     left, top, width, height = crop.box
-    right = left + width
-    bottom = top + height
-    return pil_image.crop((left, top, right, bottom))
+    # Cut the region out natively first so only crop-sized pixels are converted to PIL.
+    qimage = pixmap.copy(QRect(left, top, width, height)).toImage().convertToFormat(QImage.Format_RGB888)
+    # Decode straight from Qt's scanlines (padded to bytesPerLine): a single copy into PIL.
+    return Image.frombytes(
+        "RGB",
+        (qimage.width(), qimage.height()),
+        qimage.constBits(),
+        "raw",
+        "RGB",
+        qimage.bytesPerLine(),
+    )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -7,7 +9,7 @@ from typing import Iterable
 from PIL import Image
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportVariant:
     prefix: str
     resolution: tuple[int, int]
@@ -15,7 +17,7 @@ class ExportVariant:
     image: Image.Image
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportConfig:
     format: str = "WEBP"
     quality: int = 85
@@ -40,23 +42,30 @@ class ExportService:
         if not variants:
             raise ExportServiceError("Keine Varianten verfügbar")
 
-        output_paths: list[Path] = []
         stem = base_path.stem
         parent = base_path.parent
+        save_kwargs = dict(
+            format=self.config.format,
+            quality=self.config.quality,
+            method=self.config.method,
+        )
+        if metadata_bytes:
+            save_kwargs["xmp"] = metadata_bytes
 
-        for variant in variants:
-            width, height = variant.resolution
-            ratio_suffix = variant.ratio_suffix
-            filename = f"{variant.prefix}{stem}_{width}x{height}_{ratio_suffix}.webp"
-            target_path = parent / filename
-            save_kwargs = dict(
-                format=self.config.format,
-                quality=self.config.quality,
-                method=self.config.method,
-            )
-            if metadata_bytes:
-                save_kwargs["xmp"] = metadata_bytes
-            variant.image.save(target_path, **save_kwargs)
-            output_paths.append(target_path)
+        # WebP encoding releases the GIL, so the variants encode concurrently.
+        workers = min(len(variants), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            jobs: list[tuple[Path, Future]] = []
+            for variant in variants:
+                width, height = variant.resolution
+                ratio_suffix = variant.ratio_suffix
+                filename = f"{variant.prefix}{stem}_{width}x{height}_{ratio_suffix}.webp"
+                target_path = parent / filename
+                jobs.append((target_path, executor.submit(variant.image.save, target_path, **save_kwargs)))
+
+            output_paths: list[Path] = []
+            for target_path, job in jobs:
+                job.result()
+                output_paths.append(target_path)
 
         return output_paths
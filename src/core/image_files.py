@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import AbstractSet, Iterator
+
+
+def scan_image_files(directory: Path, extensions: AbstractSet[str]) -> list[Path]:
+    """
+    Return the files in ``directory`` whose extension is in ``extensions`` (case-insensitive).
+
+    One ``os.scandir`` pass instead of a glob per extension and case: each glob re-reads the
+    whole directory. Order is unspecified; callers sort.
+
+    Args:
+        directory: Folder to list (not recursive)
+        extensions: Lower-case suffixes with leading dot, as ``Path.suffix.lower()`` returns
+            them, e.g. ``frozenset({".png", ".jpg"})``; matched as given, without normalising
+
+    Returns:
+        Paths of matching files (symlinks to files included)
+    """
+    return [Path(entry.path) for entry in _image_entries(directory, extensions)]
+
+
+def scan_image_stats(directory: Path, extensions: AbstractSet[str]) -> list[tuple[Path, os.stat_result]]:
+    """
+    Like ``scan_image_files``, but each path comes with its ``stat()`` result.
+
+    Uses ``DirEntry.stat()``: one call per file on POSIX, and free on Windows where the
+    directory listing already carries it. Files that vanish while listing are left out.
+    """
+    images: list[tuple[Path, os.stat_result]] = []
+    for entry in _image_entries(directory, extensions):
+        try:
+            info = entry.stat()
+        except OSError:
+            continue
+        images.append((Path(entry.path), info))
+    return images
+
+
+def _image_entries(directory: Path, extensions: AbstractSet[str]) -> Iterator[os.DirEntry]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind(".")
+            if dot < 0 or name[dot:].lower() not in extensions:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            yield entry
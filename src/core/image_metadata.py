@@ -6,7 +6,7 @@ from datetime import datetime
 from PIL import Image
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImageMetadata:
     """Image metadata for tooltips and display."""
     filename: str
@@ -33,12 +33,11 @@ def extract_image_metadata(image_path: Path) -> ImageMetadata:
     Fail Fast: Raises FileNotFoundError if path doesn't exist.
     KISS: Simple PIL + os.stat, no EXIF parsing (can add later).
     """
-    # Fail Fast: Validate
-    if not image_path.exists():
-        raise FileNotFoundError(f"Image not found: {image_path}")
-
-    # Get file stats
-    stat = image_path.stat()
+    # Fail Fast: Validate and get file stats in one call
+    try:
+        stat = image_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image not found: {image_path}") from None
     file_size_mb = stat.st_size / (1024 * 1024)
     modified_dt = datetime.fromtimestamp(stat.st_mtime)
 
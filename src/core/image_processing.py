@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Sequence
 
+import cv2
+import numpy as np
 from PIL import Image, ImageFilter
 
 from .image_resize import resize_for_variant
 
+try:
+    from numba import config as numba_config, njit, prange
+
+    # Exports launch the kernel from pool threads. A first TBB launch off the main thread hangs
+    # the interpreter at exit, so prefer OpenMP (also safe for concurrent launches).
+    numba_config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Set when the Numba kernel fails to compile; exports then stay on the NumPy path.
+_numba_failed = False
+
 
 @dataclass
 class ProcessingConfig:
@@ -30,9 +48,71 @@ class ProcessingError(Exception):
     pass
 
 
+_ARRAY_SHARPEN_MODES = ("L", "RGB")
+# Below this many pixels the thread fan-out of the Numba kernel costs more than it saves.
+_NUMBA_SHARPEN_MIN_PIXELS = 256 * 256
+# Numba's default workqueue layer rejects concurrent parallel launches from several threads.
+_NUMBA_KERNEL_LOCK = threading.Lock()
+# Variant jobs on smaller sources finish faster than a thread pool starts up.
+_PARALLEL_VARIANT_MIN_PIXELS = 1024 * 1024
+
+
+def _unsharp_mask(image: Image.Image, radius: float, percent: int, threshold: int) -> Image.Image:
+    """
+    Unsharp mask on the pixel buffer, approximating ``ImageFilter.UnsharpMask``.
+
+    Threshold and gain follow Pillow's formula (gain truncated toward zero), but the blur is
+    cv2's true Gaussian where Pillow approximates it with box passes, so results differ by a few
+    levels on textured content. Difference, threshold and gain run fused in a Numba kernel when
+    available, otherwise in NumPy on one int32 buffer in place.
+    """
+    global _numba_failed
+    source = np.asarray(image)
+    blurred = cv2.GaussianBlur(source, (0, 0), sigmaX=radius, borderType=cv2.BORDER_REPLICATE)
+    if HAS_NUMBA and not _numba_failed and image.width * image.height >= _NUMBA_SHARPEN_MIN_PIXELS:
+        # Rows of interleaved samples; the result overwrites the blur buffer.
+        rows = image.height
+        try:
+            with _NUMBA_KERNEL_LOCK:
+                _unsharp_kernel(source.reshape(rows, -1), blurred.reshape(rows, -1), percent, threshold)
+        except Exception:
+            # Compilation happens on the first call; the kernel leaves the blur untouched if it fails.
+            _numba_failed = True
+        else:
+            return Image.fromarray(blurred, image.mode)
+    detail = source.astype(np.int32)
+    detail -= blurred
+    detail[np.abs(detail) < threshold] = 0
+    detail *= percent
+    # Pillow's C code divides with truncation toward zero, not floor
+    detail = np.trunc(detail / 100).astype(np.int32)
+    detail += source
+    np.clip(detail, 0, 255, out=detail)
+    return Image.fromarray(detail.astype(np.uint8), image.mode)
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True)
+    def _unsharp_kernel(src, blurred, percent, threshold):  # pragma: no cover - compiled
+        """Difference, threshold, gain and clip in one pass; writes the result into ``blurred``."""
+        height, width = src.shape
+        for y in prange(height):
+            for x in range(width):
+                value = np.int32(src[y, x])
+                diff = value - np.int32(blurred[y, x])
+                if abs(diff) >= threshold:
+                    # Truncate toward zero like Pillow; // would round negative detail down
+                    gain = diff * percent
+                    value += gain // 100 if gain >= 0 else -(-gain // 100)
+                blurred[y, x] = 0 if value < 0 else (255 if value > 255 else value)
+
+
 class ProcessingPipeline:
     def __init__(self, config: ProcessingConfig | None = None) -> None:
         self.config = config or ProcessingConfig()
+        self._unsharp_key: tuple[float, int, int] | None = None
+        self._unsharp: ImageFilter.UnsharpMask | None = None
 
     def resize_with_quality(
         self, image: Image.Image, target_width: int, target_height: int | None = None
@@ -43,34 +123,84 @@ class ProcessingPipeline:
         if target_height is None:
             aspect = height / width if width else 1.0
             target_height = max(1, int(round(target_width * aspect)))
+        if (target_width, target_height) == image.size:
+            # Image.resize would only copy; sharpening already returns a new image.
+            return self._sharpen(image)
         resized = resize_for_variant(
             image,
             target_width,
             target_height,
             resample_filter=self.config.resample_method,
         )
+        return self._sharpen(resized)
+
+    def resize_ladder(self, image: Image.Image, sizes: Sequence[tuple[int, int]]) -> list[Image.Image]:
+        """
+        Resize to several target sizes, largest first, each step reading from the previous (unsharpened) step.
 
-        sharpened = resized.filter(
-            ImageFilter.UnsharpMask(
-                radius=self.config.sharpen_radius,
-                percent=self.config.sharpen_percent,
-                threshold=self.config.sharpen_threshold,
+        Results keep the order of ``sizes``. A size equal to the source size is returned as a plain copy.
+        """
+        results: dict[int, Image.Image] = {}
+        source = image
+        for index in sorted(range(len(sizes)), key=lambda i: sizes[i][0] * sizes[i][1], reverse=True):
+            target_width, target_height = sizes[index]
+            if target_width <= 0 or target_height <= 0:
+                raise ProcessingError("Zieldimensionen müssen größer als 0 sein.")
+            if (target_width, target_height) == image.size:
+                results[index] = image.copy()
+                continue
+            if source.width < target_width or source.height < target_height:
+                source = image
+            resized = resize_for_variant(
+                source,
+                target_width,
+                target_height,
+                resample_filter=self.config.resample_method,
             )
+            results[index] = self._sharpen(resized)
+            if target_width <= image.width and target_height <= image.height:
+                source = resized
+        return [results[index] for index in range(len(sizes))]
+
+    def _sharpen(self, image: Image.Image) -> Image.Image:
+        if image.mode not in _ARRAY_SHARPEN_MODES:
+            return image.filter(self._unsharp_filter())
+        return _unsharp_mask(
+            image,
+            self.config.sharpen_radius,
+            self.config.sharpen_percent,
+            self.config.sharpen_threshold,
         )
-        return sharpened
+
+    def _unsharp_filter(self) -> ImageFilter.UnsharpMask:
+        """Shared UnsharpMask for the PIL path, rebuilt only when the sharpen settings change."""
+        key = (self.config.sharpen_radius, self.config.sharpen_percent, self.config.sharpen_threshold)
+        if self._unsharp is None or key != self._unsharp_key:
+            radius, percent, threshold = key
+            self._unsharp = ImageFilter.UnsharpMask(radius=radius, percent=percent, threshold=threshold)
+            self._unsharp_key = key
+        return self._unsharp
 
     def generate_variants(
         self, image: Image.Image, target_widths: Iterable[int]
     ) -> list[ImageVariant]:
-        variants: list[ImageVariant] = []
-        for width in target_widths:
-            processed = self.resize_with_quality(image, width)
-            variants.append(
-                ImageVariant(
-                    label=f"{width}px",
-                    width=processed.width,
-                    height=processed.height,
-                    image=processed,
+        widths = list(target_widths)
+        # Resize and blur release the GIL, so independent widths run side by side on threads.
+        if len(widths) > 1 and image.width * image.height >= _PARALLEL_VARIANT_MIN_PIXELS:
+            image.load()
+            workers = min(len(widths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                processed_images = list(
+                    executor.map(lambda width: self.resize_with_quality(image, width), widths)
                 )
+        else:
+            processed_images = [self.resize_with_quality(image, width) for width in widths]
+        return [
+            ImageVariant(
+                label=f"{width}px",
+                width=processed.width,
+                height=processed.height,
+                image=processed,
             )
-        return variants
+            for width, processed in zip(widths, processed_images)
+        ]
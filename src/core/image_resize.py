@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from PIL import Image
 
+# Downscales first shrink by an integer factor with Image.reduce until the image is at most this many
+# times the target, then run the resampling filter. At 3.0 the output is visually equivalent to a full
+# LANCZOS pass, but not identical: single pixels can differ by about a dozen levels.
+REDUCING_GAP = 3.0
+
 
 def resize_for_variant(
     image: Image.Image,
@@ -13,6 +18,8 @@ def resize_for_variant(
     """
     Resize image to target dimensions using LANCZOS resampling.
 
+    Large downscales go through a fast integer box reduction first (see ``REDUCING_GAP``).
+
     Args:
         image: Source image
         target_width: Target width in pixels
@@ -29,7 +36,7 @@ def resize_for_variant(
     if src_width <= 0 or src_height <= 0:
         raise ValueError("Ungültige Bildquelle.")
 
-    return image.resize((target_width, target_height), resample_filter)
+    return image.resize((target_width, target_height), resample_filter, reducing_gap=REDUCING_GAP)
 
 
-__all__ = ["resize_for_variant"]
+__all__ = ["REDUCING_GAP", "resize_for_variant"]
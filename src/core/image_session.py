@@ -2,15 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from PIL import Image
+from PIL import Image, ImageOps
 
 from .adjustments import AdjustmentState, apply_adjustments
 from .settings import AppSettings, VariantRule
 
 
+PREVIEW_MAX_EDGE = 1600
+
+# (image width, image height, ratio) -> (variant width, variant height)
+_DimensionResolver = Callable[[int, int, float], tuple[int, int]]
+
+
 class ImageSessionError(RuntimeError):
     pass
 
@@ -29,34 +36,47 @@ class ImageSession:
         self.original_image: Optional[Image.Image] = None
         self.base_image: Optional[Image.Image] = None
         self.ratio = RatioSelection()
+        self._preview_image: Optional[Image.Image] = None
+        # label -> (compiled rules, filename suffix); tied to the variant_rules mapping it was built from.
+        self._rule_cache: dict[str, tuple[list[tuple[str, _DimensionResolver]], str]] = {}
+        self._rule_cache_source: Optional[dict[str, list[VariantRule]]] = None
 
     def load(self, path: Path) -> Image.Image:
         try:
-            pil = Image.open(path).convert("RGB")
+            pil = _decode_rgb(Image.open(path))
         except Exception as exc:  # pragma: no cover
             raise ImageSessionError(f"Bild konnte nicht geladen werden: {exc}") from exc
         self.path = path
         self.original_image = pil
-        self.base_image = pil.copy()
+        self.base_image = pil
+        self._preview_image = None
         self.ratio = RatioSelection()
-        return self.base_image.copy()
+        return self.base_image
 
     def has_image(self) -> bool:
         return self.base_image is not None
 
     def current_base(self) -> Image.Image:
+        """
+        Return the base image itself, not a copy.
+
+        Session images are shared and treated as read-only: every processing step returns a new
+        image, so callers that want to draw into the result must ``copy()`` it themselves.
+        """
         if self.base_image is None:
             raise ImageSessionError("Kein Bild geladen.")
-        return self.base_image.copy()
+        return self.base_image
 
     def set_base_image(self, image: Image.Image) -> None:
-        self.base_image = image.copy()
+        self.base_image = image
+        self._preview_image = None
 
     def reset_base_to_original(self) -> Image.Image:
         if self.original_image is None:
             raise ImageSessionError("Kein Bild geladen.")
-        self.base_image = self.original_image.copy()
-        return self.base_image.copy()
+        self.base_image = self.original_image
+        self._preview_image = None
+        return self.base_image
 
     def set_ratio(self, label: Optional[str], value: Optional[float], custom: Optional[tuple[float, float]]) -> None:
         self.ratio = RatioSelection(label, value, custom)
@@ -65,8 +85,21 @@ class ImageSession:
         self.ratio = RatioSelection()
 
     def apply_adjustments(self, state: AdjustmentState) -> Image.Image:
-        base = self.current_base()
-        return apply_adjustments(base, state)
+        if self.base_image is None:
+            raise ImageSessionError("Kein Bild geladen.")
+        # Pass the base itself (never mutated) so repeated states hit the apply_adjustments cache.
+        return apply_adjustments(self.base_image, state)
+
+    def preview_base(self) -> Image.Image:
+        """Return the base image downscaled for interactive previews (cached until the base changes)."""
+        if self.base_image is None:
+            raise ImageSessionError("Kein Bild geladen.")
+        if self._preview_image is None:
+            self._preview_image = _fit_preview(self.base_image)
+        return self._preview_image
+
+    def apply_adjustments_preview(self, state: AdjustmentState) -> Image.Image:
+        return apply_adjustments(self.preview_base(), state)
 
     def build_variant_specs(self, image: Image.Image) -> tuple[list[tuple[str, int, int]], str]:
         label = self.ratio.label
@@ -75,14 +108,26 @@ class ImageSession:
             label, value = self._derive_ratio(image)
         if not label:
             label = "default"
-        rules = self._variant_rules(label)
+        resolvers, suffix = self._rules_and_suffix(label)
         specs: list[tuple[str, int, int]] = []
-        for rule in rules:
-            width, height = self._resolve_dimensions(rule, image, value)
-            specs.append((rule.prefix, width, height))
-        suffix = label.replace(":", "x").replace(" ", "").replace("?", "custom")
+        for prefix, resolve in resolvers:
+            width, height = resolve(image.width, image.height, value)
+            specs.append((prefix, width, height))
         return specs, suffix
 
+    def _rules_and_suffix(self, label: str) -> tuple[list[tuple[str, _DimensionResolver]], str]:
+        variant_rules = self.settings.export.variant_rules
+        if variant_rules is not self._rule_cache_source:
+            self._rule_cache.clear()
+            self._rule_cache_source = variant_rules
+        entry = self._rule_cache.get(label)
+        if entry is None:
+            suffix = label.replace(":", "x").replace(" ", "").replace("?", "custom")
+            resolvers = [(rule.prefix, _compile_rule(rule)) for rule in self._variant_rules(label)]
+            entry = (resolvers, suffix)
+            self._rule_cache[label] = entry
+        return entry
+
     def _variant_rules(self, label: str) -> list[VariantRule]:
         rules = self.settings.export.variant_rules.get(label)
         if not rules:
@@ -92,39 +137,71 @@ class ImageSession:
         return rules
 
     def _derive_ratio(self, image: Image.Image) -> tuple[str, float]:
-        width, height = image.size
-        if height == 0:
-            return "default", 1.0
-        frac = Fraction(width, height).limit_denominator(100)
-        return f"{frac.numerator}:{frac.denominator}", width / height
-
-    def _resolve_dimensions(
-        self, rule: VariantRule, image: Image.Image, ratio_value: float
-    ) -> tuple[int, int]:
-        def resolve(value, original, *, is_width: bool, other: Optional[int] = None) -> int:
-            if isinstance(value, str):
-                lowered = value.lower()
-                if lowered == "original":
-                    return original
-                if lowered == "auto":
-                    if other is None or ratio_value == 0:
-                        return original
-                    if is_width:
-                        return max(1, int(round(other * ratio_value)))
-                    return max(1, int(round(other / ratio_value)))
-            return int(value)
-
-        width_auto = isinstance(rule.width, str) and rule.width.lower() == "auto"
-        height_auto = isinstance(rule.height, str) and rule.height.lower() == "auto"
-
-        width = resolve(rule.width, image.width, is_width=True)
-        height = resolve(rule.height, image.height, is_width=False, other=width)
-
-        if width_auto and not height_auto:
-            width = max(1, int(round(height * ratio_value)))
-        if height_auto and not width_auto:
-            height = max(1, int(round(width / ratio_value)))
-        if width_auto and height_auto:
-            return image.width, image.height
-
-        return width, height
+        return _derive_ratio_cached(*image.size)
+
+
+def _decode_rgb(image: Image.Image) -> Image.Image:
+    """Decode, apply the EXIF orientation in place and convert only when the decoder did not emit RGB."""
+    image.load()
+    ImageOps.exif_transpose(image, in_place=True)
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
+
+
+def _compile_rule(rule: VariantRule) -> _DimensionResolver:
+    """
+    Turn a variant rule into a resolver with its "original"/"auto"/fixed branches decided up front.
+
+    A single "auto" side follows the ratio from the other side; two "auto" sides keep the image size.
+    """
+    width_auto = _is_auto(rule.width)
+    height_auto = _is_auto(rule.height)
+    if width_auto and height_auto:
+        return lambda width, height, ratio: (width, height)
+    if width_auto:
+        pick_height = _fixed_dimension(rule.height)
+
+        def resolve(width: int, height: int, ratio: float) -> tuple[int, int]:
+            target_height = pick_height(height)
+            return max(1, int(round(target_height * ratio))), target_height
+
+        return resolve
+    pick_width = _fixed_dimension(rule.width)
+    if height_auto:
+
+        def resolve(width: int, height: int, ratio: float) -> tuple[int, int]:
+            target_width = pick_width(width)
+            return target_width, max(1, int(round(target_width / ratio)))
+
+        return resolve
+    pick_height = _fixed_dimension(rule.height)
+    return lambda width, height, ratio: (pick_width(width), pick_height(height))
+
+
+def _is_auto(value: str | int) -> bool:
+    return isinstance(value, str) and value.lower() == "auto"
+
+
+def _fixed_dimension(value: str | int) -> Callable[[int], int]:
+    if isinstance(value, str) and value.lower() == "original":
+        return lambda original: original
+    size = int(value)
+    return lambda original: size
+
+
+def _fit_preview(image: Image.Image) -> Image.Image:
+    width, height = image.size
+    scale = min(1.0, PREVIEW_MAX_EDGE / max(width, height, 1))
+    if scale >= 1.0:
+        return image
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return image.resize(size, Image.Resampling.BILINEAR)
+
+
+@lru_cache(maxsize=128)
+def _derive_ratio_cached(width: int, height: int) -> tuple[str, float]:
+    if height == 0:
+        return "default", 1.0
+    frac = Fraction(width, height).limit_denominator(100)
+    return f"{frac.numerator}:{frac.denominator}", width / height
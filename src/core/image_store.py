@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# Undo/redo steps kept per direction; guards memory once payloads start holding pixel data.
+HISTORY_LIMIT = 50
+
 
 @dataclass
 class ImageState:
@@ -23,8 +27,8 @@ class ImageStore:
 
     original: Optional[ImageState] = None
     current: Optional[ImageState] = None
-    undo_stack: list[ImageState] = field(default_factory=list)
-    redo_stack: list[ImageState] = field(default_factory=list)
+    undo_stack: deque[ImageState] = field(default_factory=lambda: deque(maxlen=HISTORY_LIMIT))
+    redo_stack: deque[ImageState] = field(default_factory=lambda: deque(maxlen=HISTORY_LIMIT))
 
     def load(self, image_path: Path) -> None:
         self.original = ImageState(path=image_path, description="Original geladen")
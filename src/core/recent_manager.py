@@ -9,11 +9,51 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 MAX_RECENT_ITEMS = 15
 RECENT_FILE_NAME = ".image_processor_recent.json"
+# Menus ask for the lists on every repaint; re-check the filesystem at most once per interval.
+VALIDATION_TTL_SECONDS = 1.0
+
+
+def _existing_paths(paths: list[Path]) -> list[Path]:
+    """Keep the paths that still exist, reading each parent directory once instead of one stat per path."""
+    listings: dict[Path, set[str]] = {}
+    for parent in {p.parent for p in paths}:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {entry.name for entry in entries}
+        except OSError:
+            listings[parent] = set()
+    # A filesystem root has no name inside its parent; fall back to a plain stat for it.
+    return [p for p in paths if (p.name in listings[p.parent] if p.name else p.exists())]
+
+
+def _push_recent(items: OrderedDict[Path, None], path: Path) -> None:
+    """Move or insert ``path`` at the front and trim to MAX_RECENT_ITEMS."""
+    items[path] = None
+    items.move_to_end(path, last=False)
+    while len(items) > MAX_RECENT_ITEMS:
+        items.popitem(last=True)
+
+
+def _encode(data: dict) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 class RecentManager:
@@ -23,8 +63,17 @@ class RecentManager:
         self.logger = logging.getLogger(self.__class__.__name__)
         self._storage_dir = storage_dir or Path.home()
         self._storage_path = self._storage_dir / RECENT_FILE_NAME
-        self._recent_files: list[Path] = []
-        self._recent_folders: list[Path] = []
+        # Ordered sets, most recent first: re-adding an entry moves it without rebuilding the list.
+        self._recent_files: OrderedDict[Path, None] = OrderedDict()
+        self._recent_folders: OrderedDict[Path, None] = OrderedDict()
+        self._files_checked_at = float("-inf")
+        self._folders_checked_at = float("-inf")
+        self._saved_state: Optional[tuple[tuple[Path, ...], tuple[Path, ...]]] = None
+        # Writes run off the GUI thread; saves queued while one is pending collapse into the newest.
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recent-save")
+        self._save_lock = threading.Lock()
+        self._pending_payload: Optional[bytes] = None
+        self._save_future: Optional[Future] = None
         self._load()
 
     def _load(self) -> None:
@@ -39,90 +88,105 @@ class RecentManager:
             # Load files (filter out non-existent)
             for path_str in data.get("files", []):
                 path = Path(path_str)
-                if path.exists() and path.is_file():
-                    self._recent_files.append(path)
+                if path.is_file():
+                    self._recent_files[path] = None
 
             # Load folders (filter out non-existent)
             for path_str in data.get("folders", []):
                 path = Path(path_str)
-                if path.exists() and path.is_dir():
-                    self._recent_folders.append(path)
+                if path.is_dir():
+                    self._recent_folders[path] = None
 
+            self._saved_state = (tuple(self._recent_files), tuple(self._recent_folders))
             self.logger.debug("Loaded %d recent files, %d recent folders",
                               len(self._recent_files), len(self._recent_folders))
         except (json.JSONDecodeError, KeyError, TypeError) as exc:
             self.logger.warning("Failed to load recent items: %s", exc)
 
     def _save(self) -> None:
-        """Save recent items to JSON file."""
-        data = {
+        """Queue a save of the recent items (skipped when nothing changed since the last save)."""
+        state = (tuple(self._recent_files), tuple(self._recent_folders))
+        if state == self._saved_state:
+            return
+        payload = _encode({
             "files": [str(p) for p in self._recent_files],
             "folders": [str(p) for p in self._recent_folders],
-        }
+        })
+        with self._save_lock:
+            already_queued = self._pending_payload is not None
+            self._pending_payload = payload
+        if not already_queued:
+            self._save_future = self._save_executor.submit(self._write_pending)
+        self._saved_state = state
+
+    def _write_pending(self) -> None:
+        """Write the newest queued payload (runs on the save thread)."""
+        with self._save_lock:
+            payload, self._pending_payload = self._pending_payload, None
+        if payload is None:
+            return
+        tmp_path = self._storage_path.with_name(self._storage_path.name + ".tmp")
         try:
-            with open(self._storage_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            # Atomic swap: readers never see a half-written file.
+            os.replace(tmp_path, self._storage_path)
         except OSError as exc:
             self.logger.warning("Failed to save recent items: %s", exc)
+            self._saved_state = None
+
+    def flush(self) -> None:
+        """Block until queued saves have reached the disk."""
+        future = self._save_future
+        if future is not None:
+            future.result()
 
     def add_file(self, path: Path) -> None:
         """Add a file to recent files list."""
-        if not path.exists() or not path.is_file():
+        if not path.is_file():
             return
 
-        # Remove if already in list (will be re-added at top)
-        path = path.resolve()
-        self._recent_files = [p for p in self._recent_files if p != path]
-
-        # Add at beginning
-        self._recent_files.insert(0, path)
-
-        # Trim to max size
-        self._recent_files = self._recent_files[:MAX_RECENT_ITEMS]
-
+        _push_recent(self._recent_files, path.resolve())
         self._save()
 
     def add_folder(self, path: Path) -> None:
         """Add a folder to recent folders list."""
-        if not path.exists() or not path.is_dir():
+        if not path.is_dir():
             return
 
-        # Remove if already in list (will be re-added at top)
-        path = path.resolve()
-        self._recent_folders = [p for p in self._recent_folders if p != path]
-
-        # Add at beginning
-        self._recent_folders.insert(0, path)
-
-        # Trim to max size
-        self._recent_folders = self._recent_folders[:MAX_RECENT_ITEMS]
-
+        _push_recent(self._recent_folders, path.resolve())
         self._save()
 
     def recent_files(self) -> list[Path]:
         """Return list of recent files (most recent first)."""
-        # Filter out any that no longer exist
-        valid = [p for p in self._recent_files if p.exists()]
-        if len(valid) != len(self._recent_files):
-            self._recent_files = valid
-            self._save()
-        return list(valid)
+        now = time.monotonic()
+        if now - self._files_checked_at >= VALIDATION_TTL_SECONDS:
+            self._files_checked_at = now
+            # Filter out any that no longer exist
+            valid = _existing_paths(list(self._recent_files))
+            if len(valid) != len(self._recent_files):
+                self._recent_files = OrderedDict.fromkeys(valid)
+                self._save()
+        return list(self._recent_files)
 
     def recent_folders(self) -> list[Path]:
         """Return list of recent folders (most recent first)."""
-        # Filter out any that no longer exist
-        valid = [p for p in self._recent_folders if p.exists()]
-        if len(valid) != len(self._recent_folders):
-            self._recent_folders = valid
-            self._save()
-        return list(valid)
+        now = time.monotonic()
+        if now - self._folders_checked_at >= VALIDATION_TTL_SECONDS:
+            self._folders_checked_at = now
+            # Filter out any that no longer exist
+            valid = _existing_paths(list(self._recent_folders))
+            if len(valid) != len(self._recent_folders):
+                self._recent_folders = OrderedDict.fromkeys(valid)
+                self._save()
+        return list(self._recent_folders)
 
     def clear_files(self) -> None:
         """Clear all recent files."""
-        self._recent_files = []
+        self._recent_files.clear()
         self._save()
 
     def clear_folders(self) -> None:
         """Clear all recent folders."""
-        self._recent_folders = []
+        self._recent_folders.clear()
         self._save()
@@ -7,6 +7,12 @@ from typing import Any
 
 from PIL import Image
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 @dataclass
 class ProcessingSettings:
@@ -76,9 +82,10 @@ def load_settings(path: Path | None = None) -> AppSettings:
     data = DEFAULT_SETTINGS
     if base_path.exists():
         try:
-            with base_path.open("r", encoding="utf-8") as fh:
-                file_data = json.load(fh)
-                data = _merge_settings(DEFAULT_SETTINGS, file_data)
+            raw = base_path.read_bytes()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both.
+            file_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            data = _merge_settings(DEFAULT_SETTINGS, file_data)
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"Settings-Datei ungültig: {exc}") from exc
 
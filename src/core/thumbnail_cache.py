@@ -1,11 +1,27 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+
+from .image_resize import REDUCING_GAP
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
 
 THUMBNAIL_SIZE = 256
+THUMBNAIL_SUFFIXES = (".png", ".webp")
+CLEAR_WORKERS = 16
 
 
 class ThumbnailCache:
@@ -18,24 +34,37 @@ class ThumbnailCache:
     KISS: Simple file-based cache, no database.
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        freedesktop_compat: bool = True,
+        use_webp: bool = False,
+    ) -> None:
+        """
+        ``freedesktop_compat=False`` marks the cache as private: file names are then keyed with
+        BLAKE3 (or BLAKE2b without the ``blake3`` package) instead of the MD5 the standard requires.
+        ``use_webp=True`` stores thumbnails as fast-encoded lossy WebP instead of standard PNG.
+        """
         if cache_dir is None:
             # Use project-local cache to avoid permission issues outside workspace
             cache_dir = Path(__file__).resolve().parents[2] / ".cache" / "thumbnails" / "normal"
 
         self.cache_dir = cache_dir
+        self.freedesktop_compat = freedesktop_compat
+        self.use_webp = use_webp
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def get_thumbnail_path(self, image_path: Path) -> Path:
-        """Generate cache path using MD5 of absolute URI (freedesktop.org standard)."""
+        """Generate cache path from a hash of the absolute URI (MD5 per freedesktop.org standard)."""
         # Fail Fast: Validate path
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        # freedesktop.org: MD5 of file:// URI
-        uri = f"file://{image_path.absolute()}"
-        md5_hash = hashlib.md5(uri.encode()).hexdigest()
-        return self.cache_dir / f"{md5_hash}.png"
+        return self._cache_path(image_path)
+
+    def _cache_path(self, image_path: Path) -> Path:
+        suffix = ".webp" if self.use_webp else ".png"
+        return self.cache_dir / (_thumbnail_name(str(image_path.absolute()), self.freedesktop_compat) + suffix)
 
     def get_thumbnail(self, image_path: Path) -> Optional[Path]:
         """
@@ -43,14 +72,18 @@ class ThumbnailCache:
         Returns None if cache miss or invalid.
         """
         try:
-            thumb_path = self.get_thumbnail_path(image_path)
+            # One stat per file: the source stat doubles as the existence check
+            source_mtime = image_path.stat().st_mtime
+            thumb_path = self._cache_path(image_path)
 
             # Check if cached thumbnail exists
-            if not thumb_path.exists():
+            try:
+                thumb_mtime = thumb_path.stat().st_mtime
+            except FileNotFoundError:
                 return None
 
             # Validate: thumbnail should be newer than original
-            if thumb_path.stat().st_mtime < image_path.stat().st_mtime:
+            if thumb_mtime < source_mtime:
                 # Original was modified, cache invalid
                 thumb_path.unlink(missing_ok=True)
                 return None
@@ -69,24 +102,45 @@ class ThumbnailCache:
         KISS: Simple PIL thumbnail generation.
         """
         # Fail Fast: Validate
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image not found: {image_path}")
+        try:
+            source_stat = image_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image not found: {image_path}") from None
 
-        if not image_path.is_file():
+        if not stat.S_ISREG(source_stat.st_mode):
             raise ValueError(f"Not a file: {image_path}")
 
         try:
             # Generate thumbnail
             with Image.open(image_path) as img:
+                # Let JPEG decode at a reduced scale; must happen before anything loads the pixels
+                img.draft("RGB", (THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+
                 # Convert to RGB for consistent format
                 img = img.convert("RGB")
 
-                # Create thumbnail (maintains aspect ratio)
-                img.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS)
-
-                # Save to cache
-                thumb_path = self.get_thumbnail_path(image_path)
-                img.save(thumb_path, "PNG")
+                # Create thumbnail (maintains aspect ratio; integer reduce before LANCZOS)
+                img.thumbnail(
+                    (THUMBNAIL_SIZE, THUMBNAIL_SIZE),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=REDUCING_GAP,
+                )
+
+                # Save to cache under a unique temporary name, then swap it in atomically:
+                # other grids' tasks read this path concurrently and must never see a partial file.
+                thumb_path = self._cache_path(image_path)
+                fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=thumb_path.stem, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as tmp_file:
+                        if self.use_webp:
+                            # method=0 is libwebp's fastest encoder; PNG's zlib pass costs far more
+                            img.save(tmp_file, "WEBP", quality=85, method=0)
+                        else:
+                            img.save(tmp_file, "PNG", pnginfo=_thumbnail_info(image_path, source_stat))
+                    os.replace(tmp_name, thumb_path)
+                except BaseException:
+                    _unlink_missing_ok(tmp_name)
+                    raise
 
                 return thumb_path
 
@@ -110,5 +164,39 @@ class ThumbnailCache:
 
     def clear_cache(self) -> None:
         """Clear all cached thumbnails."""
-        for thumb in self.cache_dir.glob("*.png"):
-            thumb.unlink(missing_ok=True)
+        with os.scandir(self.cache_dir) as entries:
+            thumbs = [entry.path for entry in entries if entry.name.endswith(THUMBNAIL_SUFFIXES)]
+        # unlink() releases the GIL; a few threads keep the filesystem queue busy on large caches
+        with ThreadPoolExecutor(max_workers=CLEAR_WORKERS) as executor:
+            list(executor.map(_unlink_missing_ok, thumbs))
+
+
+@lru_cache(maxsize=4096)
+def _thumbnail_name(absolute_path: str, freedesktop_compat: bool) -> str:
+    """Cache file stem for an image; memoised so scrolling a gallery does not re-hash the same URIs."""
+    uri = f"file://{absolute_path}".encode()
+    if freedesktop_compat:
+        # freedesktop.org: MD5 of file:// URI
+        digest = hashlib.md5(uri).hexdigest()
+    elif HAS_BLAKE3:
+        digest = blake3.blake3(uri).hexdigest(length=16)
+    else:
+        digest = hashlib.blake2b(uri, digest_size=16).hexdigest()
+    return digest
+
+
+def _thumbnail_info(image_path: Path, source_stat: os.stat_result) -> PngInfo:
+    """freedesktop.org attributes, so other thumbnail consumers can validate our PNGs."""
+    info = PngInfo()
+    info.add_text("Thumb::URI", f"file://{image_path.absolute()}")
+    info.add_text("Thumb::MTime", str(int(source_stat.st_mtime)))
+    info.add_text("Thumb::Size", str(source_stat.st_size))
+    info.add_text("Software", "AA Image Processor")
+    return info
+
+
+def _unlink_missing_ok(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -3,15 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from PySide6.QtCore import QRectF, Qt, QPointF, Signal
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QImage, QAction
-from PySide6.QtWidgets import QWidget, QLabel, QMenu
+from PySide6.QtCore import QRect, QRectF, Qt, QPointF, Signal
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QAction, QPixmap
+from PySide6.QtWidgets import QWidget, QMenu
 from PIL import Image
-from .magnifier_widget import MagnifierWidget
+from .magnifier_widget import MAGNIFIER_BORDER_COLOR, MAGNIFIER_BORDER_WIDTH, FrameThrottle, MagnifierSource
 
 
-@dataclass
+@dataclass(slots=True)
 class CropSelection:
+    """Current selection; updated in place while dragging so no objects are allocated per event."""
+
     rect: QRectF
     aspect_ratio: float
 
@@ -32,50 +34,83 @@ class CropOverlay(QWidget):
         self._selection: Optional[CropSelection] = None
         self._overlay_color = QColor(255, 0, 0, 50)
         self._border_color = QColor(255, 0, 0)
+        # Paint objects built once here, not per paintEvent
+        self._handle_brush = QBrush(QColor(255, 255, 255))
+        self._mag_border_pen = QPen(MAGNIFIER_BORDER_COLOR, MAGNIFIER_BORDER_WIDTH)
+        self._build_pens()
         self._dragging = False
         self._resizing = False
         self._drag_offset = QPointF()
         self._active_handle: Optional[str] = None
+        # Widget bounds for the running drag/resize gesture, fetched once in mousePressEvent
+        self._drag_bounds: Optional[QRect] = None
         self.handle_size = 12
+        self._handle_cache: Optional[tuple[tuple[str, QPointF], ...]] = None
 
-        # Magnifier setup (using reusable widget with 400px size)
-        self.magnifier_label = MagnifierWidget(self, size=400)
+        # Magnifier (400px), painted by this overlay so selection and magnifier share one paint pass
+        self._magnifier = MagnifierSource(size=400)
+        self._mag_pixmap: Optional[QPixmap] = None
+        self._mag_rect = QRect()
         self._canvas_image: Optional[Image.Image] = None
         self._canvas_rect: QRectF = QRectF()
         self._canvas_scale: float = 1.0
+        self._mag_throttle = FrameThrottle(self._update_magnifier, self)
 
     def set_selection(self, rect: QRectF, ratio: float) -> None:
-        self._selection = CropSelection(rect=rect, aspect_ratio=ratio)
+        if self._selection is None:
+            # Own copy: the rectangle is mutated in place during drags
+            self._selection = CropSelection(rect=QRectF(rect), aspect_ratio=ratio)
+        else:
+            self._selection.rect.setRect(rect.x(), rect.y(), rect.width(), rect.height())
+            self._selection.aspect_ratio = ratio
+        self._handle_cache = None
         self.show()  # Ensure overlay is visible
         self.update()
 
+    def _build_pens(self) -> None:
+        self._border_pen = QPen(self._border_color, 2)
+        self._overlay_brush = QBrush(self._overlay_color)
+        self._handle_pen = QPen(self._border_color, 1)
+
     def clear_selection(self) -> None:
         self._selection = None
-        self.magnifier_label.hide()
+        self._handle_cache = None
+        self._hide_magnifier()
         self.update()
 
     def current_selection(self) -> Optional[CropSelection]:
         return self._selection
 
     def set_canvas_info(self, pil_image: Optional[Image.Image], image_rect: QRectF, scale: float) -> None:
-        """Set canvas information for magnifier functionality."""
-        self._canvas_image = pil_image.copy() if pil_image else None
+        """
+        Set canvas information for magnifier functionality.
+
+        The image is borrowed, not copied: the overlay only reads it, and callers replace rather than
+        mutate canvas images.
+        """
+        self._canvas_image = pil_image
         self._canvas_rect = QRectF(image_rect)
         self._canvas_scale = scale
+        self._magnifier.set_source(self._canvas_image)
 
     def paintEvent(self, event) -> None:
         super().paintEvent(event)
-        if not self._selection:
+        if not self._selection and self._mag_pixmap is None:
             return
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        pen = QPen(self._border_color, 2)
-        painter.setPen(pen)
-        painter.setBrush(QBrush(self._overlay_color))
-        painter.drawRect(self._selection.rect)
-        self._draw_handles(painter)
+        dirty = event.rect()
+        if self._selection:
+            painter.setRenderHint(QPainter.Antialiasing)
+
+            # Fill and border only when the dirty area touches them (not for magnifier or lone handle repaints)
+            if dirty.intersects(self._selection.rect.toAlignedRect().adjusted(-2, -2, 2, 2)):
+                painter.setPen(self._border_pen)
+                painter.setBrush(self._overlay_brush)
+                painter.drawRect(self._selection.rect)
+            self._draw_handles(painter, dirty)
+        if self._mag_pixmap is not None and dirty.intersects(self._mag_rect):
+            self._draw_magnifier(painter)
 
     # Interaction handling ----------------------------------------------------
     def mousePressEvent(self, event) -> None:
@@ -96,19 +131,26 @@ class CropOverlay(QWidget):
         else:
             event.ignore()
             return
+        self._drag_bounds = self.rect()
         event.accept()
 
     def mouseMoveEvent(self, event) -> None:
         # Handle crop operations if active
         if self._dragging or self._resizing:
+            # The selection is updated in place, so capture the old geometry first
+            previous_rounded = self._selection.rect.toRect()
+            previous_dirty = self._dirty_rect(self._selection.rect)
             if self._dragging:
                 new_top_left = event.position() - self._drag_offset
                 self._move_selection(new_top_left)
             elif self._resizing:
                 self._resize_selection(event.position())
-            self.update()
+            # Sub-pixel jitter that leaves the rounded rectangle in place needs no repaint
+            if self._selection.rect.toRect() != previous_rounded:
+                # Only the old and new selection areas (plus handles) change
+                self.update(previous_dirty.united(self._dirty_rect(self._selection.rect)))
             event.accept()
-            self.magnifier_label.hide()
+            self._hide_magnifier()
             return
 
         # Show magnifier if mouse is over image and not near handles
@@ -116,14 +158,15 @@ class CropOverlay(QWidget):
             # Check if near handles
             near_handle = False
             if self._selection:
-                near_handle = self._hit_test_handles(event.position()) is not None
+                position = event.position()
+                near_handle = self._hit_test_handles_fast(position.x(), position.y()) is not None
 
             if not near_handle:
-                self._update_magnifier(event.position())
+                self._mag_throttle.request(QPointF(event.position()))
             else:
-                self.magnifier_label.hide()
+                self._hide_magnifier()
         else:
-            self.magnifier_label.hide()
+            self._hide_magnifier()
 
         event.ignore()  # Let parent handle if not consumed
 
@@ -131,9 +174,13 @@ class CropOverlay(QWidget):
         if event.button() != Qt.LeftButton:
             event.ignore()
             return
+        if self._dragging or self._resizing:
+            # Paint the exact final rectangle, including sub-pixel moves skipped while dragging
+            self.update(self._dirty_rect(self._selection.rect))
         self._dragging = False
         self._resizing = False
         self._active_handle = None
+        self._drag_bounds = None
         event.accept()
 
     def mouseDoubleClickEvent(self, event) -> None:
@@ -161,75 +208,159 @@ class CropOverlay(QWidget):
         menu.exec(event.globalPos())
 
     # Internal helpers -------------------------------------------------------
-    def _draw_handles(self, painter: QPainter) -> None:
+    def _draw_handles(self, painter: QPainter, clip: QRect) -> None:
         if not self._selection:
             return
         handle_positions = self._calculate_handle_positions()
-        painter.setBrush(QBrush(QColor(255, 255, 255)))
-        painter.setPen(QPen(self._border_color, 1))
-        for pos in handle_positions.values():
-            rect = QRectF(pos.x() - self.handle_size / 2, pos.y() - self.handle_size / 2, self.handle_size, self.handle_size)
-            painter.drawRect(rect)
-
-    def _calculate_handle_positions(self) -> dict[str, QPointF]:
-        rect = self._selection.rect
-        return {
-            "top_left": rect.topLeft(),
-            "top_right": rect.topRight(),
-            "bottom_left": rect.bottomLeft(),
-            "bottom_right": rect.bottomRight(),
-        }
+        painter.setBrush(self._handle_brush)
+        painter.setPen(self._handle_pen)
+        clip_rect = QRectF(clip)
+        size = self.handle_size
+        half = size / 2
+        rects = [
+            rect
+            for rect in (QRectF(pos.x() - half, pos.y() - half, size, size) for _name, pos in handle_positions)
+            if clip_rect.intersects(rect)
+        ]
+        if rects:
+            # One painter call for all handles instead of one per handle
+            painter.drawRects(rects)
+
+    def _dirty_rect(self, rect: QRectF) -> QRect:
+        """Widget area touched when painting ``rect``: the fill, the 2px border and half a handle around it."""
+        margin = self.handle_size // 2 + 2
+        return rect.toAlignedRect().adjusted(-margin, -margin, margin, margin)
+
+    def _calculate_handle_positions(self) -> tuple[tuple[str, QPointF], ...]:
+        """Handle name/position pairs, memoised until the selection changes."""
+        if self._handle_cache is None:
+            rect = self._selection.rect
+            self._handle_cache = (
+                ("top_left", rect.topLeft()),
+                ("top_right", rect.topRight()),
+                ("bottom_left", rect.bottomLeft()),
+                ("bottom_right", rect.bottomRight()),
+            )
+        return self._handle_cache
 
     def _hit_test_handles(self, point: QPointF) -> Optional[str]:
-        handles = self._calculate_handle_positions()
-        for name, pos in handles.items():
+        for name, pos in self._calculate_handle_positions():
             rect = QRectF(pos.x() - self.handle_size, pos.y() - self.handle_size, self.handle_size * 2, self.handle_size * 2)
             if rect.contains(point):
                 return name
         return None
 
+    def _hit_test_handles_fast(self, x: float, y: float) -> Optional[str]:
+        """Same hit zones as _hit_test_handles, as plain float comparisons for the hover path."""
+        rect = self._selection.rect
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        h = self.handle_size
+        near_left = abs(x - left) <= h
+        near_right = abs(x - right) <= h
+        if abs(y - top) <= h:
+            if near_left:
+                return "top_left"
+            if near_right:
+                return "top_right"
+        if abs(y - bottom) <= h:
+            if near_left:
+                return "bottom_left"
+            if near_right:
+                return "bottom_right"
+        return None
+
     def _move_selection(self, new_top_left: QPointF) -> None:
-        rect = QRectF(new_top_left, self._selection.rect.size())
-        rect = self._confine_to_bounds(rect)
-        self._selection = CropSelection(rect=rect, aspect_ratio=self._selection.aspect_ratio)
+        self._selection.rect.moveTopLeft(new_top_left)
+        self._confine_to_bounds(self._selection.rect)
+        self._handle_cache = None
 
     def _resize_selection(self, cursor_pos: QPointF) -> None:
         # Simplified resize keeping aspect ratio; adjust width based on horizontal distance.
-        bounds = self.rect()
+        # Plain float math per event; same clamping as _confine_to_bounds, written back in place.
+        bounds = self._current_bounds()
         rect = self._selection.rect
-        center = rect.center()
-        width = abs(cursor_pos.x() - center.x()) * 2
-        height = width / self._selection.aspect_ratio
+        ratio = self._selection.aspect_ratio
+        center_x = rect.x() + rect.width() * 0.5
+        center_y = rect.y() + rect.height() * 0.5
+        width = abs(cursor_pos.x() - center_x) * 2
+        height = width / ratio
         if height > bounds.height():
             height = bounds.height()
-            width = height * self._selection.aspect_ratio
-        new_rect = QRectF(center.x() - width / 2, center.y() - height / 2, width, height)
-        new_rect = self._confine_to_bounds(new_rect)
-        self._selection = CropSelection(rect=new_rect, aspect_ratio=self._selection.aspect_ratio)
+            width = height * ratio
+        x = center_x - width / 2
+        y = center_y - height / 2
+        if x < bounds.left():
+            x = bounds.left()
+        if x + width > bounds.right():
+            x = bounds.right() - width
+        if y < bounds.top():
+            y = bounds.top()
+        if y + height > bounds.bottom():
+            y = bounds.bottom() - height
+        rect.setRect(x, y, width, height)
+        self._handle_cache = None
 
     def _confine_to_bounds(self, rect: QRectF) -> QRectF:
-        bounds = self.rect()
-        if rect.left() < bounds.left():
-            rect.moveLeft(bounds.left())
-        if rect.right() > bounds.right():
-            rect.moveRight(bounds.right())
-        if rect.top() < bounds.top():
-            rect.moveTop(bounds.top())
-        if rect.bottom() > bounds.bottom():
-            rect.moveBottom(bounds.bottom())
+        # Clamp in floats and move once; the right/bottom edge wins when the rect is larger than bounds
+        bounds = self._current_bounds()
+        x = min(max(rect.x(), bounds.left()), bounds.right() - rect.width())
+        y = min(max(rect.y(), bounds.top()), bounds.bottom() - rect.height())
+        rect.moveTo(x, y)
         return rect
 
+    def _current_bounds(self) -> QRect:
+        return self._drag_bounds if self._drag_bounds is not None else self.rect()
+
     def leaveEvent(self, event) -> None:
         """Hide magnifier when mouse leaves overlay."""
-        self.magnifier_label.hide()
+        self._hide_magnifier()
         super().leaveEvent(event)
 
+    def _hide_magnifier(self) -> None:
+        self._mag_throttle.cancel()
+        self._magnifier.forget()
+        if self._mag_pixmap is not None:
+            self._mag_pixmap = None
+            self.update(self._mag_rect)
+
     def _update_magnifier(self, cursor_pos) -> None:
-        """Update magnifier position and content using reusable widget."""
-        self.magnifier_label.update_magnifier(
-            cursor_pos,
-            self._canvas_image,
-            self._canvas_rect,
-            self._canvas_scale,
-            (self.width(), self.height())
-        )
+        """Update magnifier position and content; painted in paintEvent."""
+        # Nothing would be seen: hidden or fully covered overlay, backgrounded window, or empty image
+        image = self._canvas_image
+        if (
+            not self.isVisible()
+            or self.visibleRegion().isEmpty()
+            or not self.isActiveWindow()
+            or image is None
+            or image.width * image.height == 0
+        ):
+            self._hide_magnifier()
+            return
+        try:
+            result = self._magnifier.view(
+                cursor_pos,
+                self._canvas_image,
+                self._canvas_rect,
+                self._canvas_scale,
+                (self.width(), self.height())
+            )
+        except Exception:
+            # Fail Fast: Hide on any error
+            result = None
+        if result is None:
+            self._hide_magnifier()
+            return
+        pixmap, position = result
+        old_rect = self._mag_rect if self._mag_pixmap is not None else QRect()
+        self._mag_pixmap = pixmap
+        self._mag_rect = QRect(position, pixmap.size())
+        self.update(old_rect.united(self._mag_rect))
+
+    def _draw_magnifier(self, painter: QPainter) -> None:
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.drawPixmap(self._mag_rect.topLeft(), self._mag_pixmap)
+        # Border drawn inside the pixmap area, like the framed magnifier label elsewhere
+        half = MAGNIFIER_BORDER_WIDTH / 2
+        painter.setPen(self._mag_border_pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(QRectF(self._mag_rect).adjusted(half, half, -half, -half))
@@ -11,6 +11,8 @@ from .thumbnail_grid import ThumbnailGridView
 
 # Delay before loading thumbnails (ms) - prevents lag while navigating
 THUMBNAIL_LOAD_DELAY_MS = 3000
+# Upper bound while the selection keeps changing; this timer is not restarted by further selections
+THUMBNAIL_MAX_DELAY_MS = 5000
 
 
 class FileBrowserSidebar(QWidget):
@@ -32,6 +34,9 @@ class FileBrowserSidebar(QWidget):
         self._thumbnail_timer = QTimer(self)
         self._thumbnail_timer.setSingleShot(True)
         self._thumbnail_timer.timeout.connect(self._load_pending_thumbnails)
+        self._thumbnail_max_timer = QTimer(self)
+        self._thumbnail_max_timer.setSingleShot(True)
+        self._thumbnail_max_timer.timeout.connect(self._load_pending_thumbnails)
 
         # Main layout
         layout = QVBoxLayout(self)
@@ -86,16 +91,19 @@ class FileBrowserSidebar(QWidget):
         # Update label immediately
         self.grid_label.setText(f"<b>{directory.name}</b>")
 
-        # Clear current thumbnails immediately
-        self.thumbnail_grid.clear()
-
-        # Store pending directory and restart timer
+        # Store pending directory and restart timer; the grid is only cleared when loading,
+        # so arrow-key navigation through the tree does no grid work per step
         self._pending_directory = directory
         self._thumbnail_timer.stop()
         self._thumbnail_timer.start(THUMBNAIL_LOAD_DELAY_MS)
+        if not self._thumbnail_max_timer.isActive():
+            self._thumbnail_max_timer.start(THUMBNAIL_MAX_DELAY_MS)
 
     def _load_pending_thumbnails(self) -> None:
         """Load thumbnails after delay."""
+        self._thumbnail_timer.stop()
+        self._thumbnail_max_timer.stop()
         if self._pending_directory:
+            # load_directory clears the grid before filling it
             self.thumbnail_grid.load_directory(self._pending_directory)
             self._pending_directory = None
@@ -27,6 +27,9 @@ class FileTreeView(QTreeView):
 
         # Setup file system model (directories only)
         self.model = QFileSystemModel()
+        # Per-entry icon lookups and change watchers cost syscalls; slow on network mounts
+        self.model.setOption(QFileSystemModel.DontUseCustomDirectoryIcons, True)
+        self.model.setOption(QFileSystemModel.DontWatchForChanges, True)
         self.model.setRootPath(str(start_path))
         self.model.setFilter(QDir.Dirs | QDir.NoDotAndDotDot)
 
@@ -43,6 +46,7 @@ class FileTreeView(QTreeView):
         self.setHeaderHidden(True)
         self.setAnimated(True)
         self.setIndentation(20)
+        self.setUniformRowHeights(True)  # One-line folder names: skip measuring every row
         self.setExpandsOnDoubleClick(True)
 
         # Connect selection signal
@@ -50,20 +54,16 @@ class FileTreeView(QTreeView):
 
     def _on_clicked(self, index) -> None:
         """Handle directory click."""
-        # Get path from index
-        path_str = self.model.filePath(index)
-        path = Path(path_str)
-
-        # Fail Fast: Validate
-        if not path.exists() or not path.is_dir():
+        # Fail Fast: Validate (the model already knows the entry type, no stat needed)
+        if not self.model.isDir(index):
             return
 
         # Emit signal
-        self.directory_selected.emit(path)
+        self.directory_selected.emit(Path(self.model.filePath(index)))
 
     def set_root_path(self, path: Path) -> None:
         """Change root directory."""
-        if not path.exists() or not path.is_dir():
+        if not path.is_dir():
             raise ValueError(f"Invalid directory: {path}")
 
         self.model.setRootPath(str(path))
@@ -71,7 +71,7 @@ class FileTreeView(QTreeView):
 
     def navigate_to(self, path: Path) -> None:
         """Navigate to and select a specific directory."""
-        if not path.exists() or not path.is_dir():
+        if not path.is_dir():
             return
 
         index = self.model.index(str(path))
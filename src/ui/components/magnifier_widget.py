@@ -1,38 +1,161 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
-from PySide6.QtCore import QPointF, QRectF
-from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import QObject, QPoint, QPointF, QRect, QRectF, Qt, QTimer
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QWidget
 from PIL import Image
 
+MAGNIFIER_BORDER_COLOR = QColor("#ff6600")
+MAGNIFIER_BORDER_WIDTH = 2
+# Magnifier refresh interval; mouse moves in between only update the pending cursor (~60 Hz).
+MAGNIFIER_FRAME_MS = 16
 
-class MagnifierWidget(QLabel):
+
+class FrameThrottle(QObject):
     """
-    Reusable magnifier widget that shows 1:1 pixel view of image area under cursor.
+    Runs ``callback`` at most once per magnifier frame.
 
-    KISS: Simple QLabel with pixmap, no complex logic.
+    The first request runs at once; requests within the frame only replace the pending arguments,
+    which run when the frame ends. Arguments are stored as given, so callers pass copies of
+    event-owned values.
     """
 
-    def __init__(self, parent=None, size: int = 150) -> None:
+    def __init__(self, callback: Callable[..., None], parent: QObject) -> None:
         super().__init__(parent)
-        self.setFrameStyle(QLabel.Box | QLabel.Plain)
-        self.setLineWidth(2)
-        self.setStyleSheet("border: 2px solid #ff6600; background: white;")
-        self.hide()
+        self._callback = callback
+        self._pending: Optional[tuple] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(MAGNIFIER_FRAME_MS)
+        self._timer.timeout.connect(self._flush)
+
+    def request(self, *args) -> None:
+        if self._timer.isActive():
+            self._pending = args
+            return
+        self._timer.start()
+        self._callback(*args)
+
+    def cancel(self) -> None:
+        """Drop the pending request; the next one runs at once."""
+        self._timer.stop()
+        self._pending = None
+
+    def _flush(self) -> None:
+        args = self._pending
+        if args is None:
+            return
+        self._pending = None
+        # Keep throttling while requests keep arriving
+        self._timer.start()
+        self._callback(*args)
+
+
+def crop_box(center_x: int, center_y: int, size: int, width: int, height: int) -> tuple[int, int, int, int]:
+    """
+    Return the (left, top, right, bottom) box of ``size`` around a center, kept inside the image.
+
+    Near an edge the box shifts inward instead of shrinking; only an image smaller than
+    ``size`` yields a smaller box.
+    """
+    half = size >> 1
+    left = min(max(center_x - half, 0), max(0, width - size))
+    top = min(max(center_y - half, 0), max(0, height - size))
+    return left, top, left + min(size, width), top + min(size, height)
+
+
+class MagnifierSource:
+    """
+    Computes the 1:1 magnifier pixmap and its placement; holds no widget.
+
+    Shared by MagnifierWidget and by overlays that paint the magnifier themselves.
+    """
+
+    def __init__(self, size: int = 150, kept_sources: int = 1) -> None:
         self._magnifier_size = size
+        # Most recently used converted sources (image, bytes, QImage), newest last; more than one
+        # lets hovering back and forth between images skip the full-image conversion
+        self._kept_sources = max(1, kept_sources)
+        self._converted: list[tuple[Image.Image, bytes, QImage]] = []
+        # Source of the current pixmap; sub-pixel cursor moves map to the same box and skip the re-crop.
+        self._last_image: Optional[Image.Image] = None
+        self._last_box: Optional[tuple[int, int, int, int]] = None
+        self._pixmap: Optional[QPixmap] = None
+        # Reused pixmap the crops are painted into; reallocated only when the crop size changes.
+        # A consumer holding this very pixmap sees the same object (and cacheKey) after a re-crop,
+        # so ``crop_serial`` tells it when the content changed.
+        self._canvas: Optional[QPixmap] = None
+        self.crop_serial = 0
+        # Whole source image as one RGB QImage; per-move crops are then a C++ sub-rect copy.
+        self._source_image: Optional[Image.Image] = None
+        self._source_bytes: Optional[bytes] = None
+        self._source_qimage: Optional[QImage] = None
 
-    def update_magnifier(
+    def set_source(self, image: Optional[Image.Image]) -> None:
+        """Convert ``image`` to the cached QImage up front (otherwise done on the first update)."""
+        if image is self._source_image:
+            return
+        self._source_image = image
+        self._source_bytes = None
+        self._source_qimage = None
+        self.forget()
+        if image is None:
+            return
+        for index, entry in enumerate(self._converted):
+            if entry[0] is image:
+                del self._converted[index]
+                break
+        else:
+            rgb = image if image.mode == "RGB" else image.convert("RGB")
+            # QImage only borrows the buffer, so the bytes must live as long as the QImage.
+            data = rgb.tobytes("raw", "RGB")
+            entry = (image, data, QImage(data, rgb.width, rgb.height, rgb.width * 3, QImage.Format_RGB888))
+        self._converted.append(entry)
+        del self._converted[:-self._kept_sources]
+        _, self._source_bytes, self._source_qimage = entry
+
+    def forget(self) -> None:
+        """Drop the current pixmap so the next view re-crops."""
+        self._last_image = None
+        self._last_box = None
+        self._pixmap = None
+
+    def crop(self, image: Image.Image, box: tuple[int, int, int, int]) -> QPixmap:
+        """
+        Return ``box`` (left, top, right, bottom) of ``image`` as a 1:1 pixmap.
+
+        The image is converted once per source; repeated boxes return the current pixmap unchanged.
+        """
+        if image is not self._last_image or box != self._last_box:
+            self.set_source(image)
+            left, top, right, bottom = box
+            self._pixmap = self._paint_crop(left, top, right - left, bottom - top)
+            self._last_image = image
+            self._last_box = box
+            self.crop_serial += 1
+        return self._pixmap
+
+    def _paint_crop(self, left: int, top: int, width: int, height: int) -> QPixmap:
+        canvas = self._canvas
+        if canvas is None or canvas.width() != width or canvas.height() != height:
+            canvas = self._canvas = QPixmap(width, height)
+        painter = QPainter(canvas)
+        painter.drawImage(QPoint(0, 0), self._source_qimage, QRect(left, top, width, height))
+        painter.end()
+        return canvas
+
+    def view(
         self,
         cursor_pos: QPointF,
         image: Image.Image,
         image_rect: QRectF,
         scale: float,
         parent_size: tuple[int, int]
-    ) -> None:
+    ) -> Optional[tuple[QPixmap, QPoint]]:
         """
-        Update magnifier position and content.
+        Return the magnifier pixmap and its top-left position, or None when nothing should show.
 
         Args:
             cursor_pos: Current cursor position in parent coordinates
@@ -42,8 +165,7 @@ class MagnifierWidget(QLabel):
             parent_size: (width, height) of parent widget for boundary checking
         """
         if not image or not image_rect.isValid() or scale <= 0:
-            self.hide()
-            return
+            return None
 
         # Map cursor position to image coordinates
         local_x = cursor_pos.x() - image_rect.x()
@@ -51,58 +173,134 @@ class MagnifierWidget(QLabel):
 
         # Check if cursor is within image bounds
         if local_x < 0 or local_y < 0 or local_x > image_rect.width() or local_y > image_rect.height():
-            self.hide()
-            return
+            return None
 
         # Convert to original image coordinates
         img_x = int(local_x / scale)
         img_y = int(local_y / scale)
 
         # Calculate crop region in original image (1:1 scale)
-        crop_size = self._magnifier_size
-        left = max(0, img_x - crop_size // 2)
-        top = max(0, img_y - crop_size // 2)
-        right = min(image.width, left + crop_size)
-        bottom = min(image.height, top + crop_size)
-
-        # Adjust if we hit image boundaries
-        if right - left < crop_size:
-            left = max(0, right - crop_size)
-        if bottom - top < crop_size:
-            top = max(0, bottom - crop_size)
-
-        # Crop and display
-        try:
-            cropped = image.crop((left, top, right, bottom))
+        box = crop_box(img_x, img_y, self._magnifier_size, image.width, image.height)
+        pixmap = self.crop(image, box)
 
-            # Convert PIL to QPixmap
-            img_rgb = cropped.convert("RGB")
-            data = img_rgb.tobytes("raw", "RGB")
-            qimage = QImage(data, img_rgb.width, img_rgb.height, img_rgb.width * 3, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
+        # Position magnifier near cursor (right-bottom by default)
+        offset = 20
+        mag_x = int(cursor_pos.x() + offset)
+        mag_y = int(cursor_pos.y() + offset)
 
-            self.setPixmap(pixmap)
-            self.resize(pixmap.size())
+        parent_width, parent_height = parent_size
 
-            # Position magnifier near cursor (right-bottom by default)
-            offset = 20
-            mag_x = int(cursor_pos.x() + offset)
-            mag_y = int(cursor_pos.y() + offset)
+        # If magnifier would go off screen right, move to left
+        if mag_x + pixmap.width() > parent_width:
+            mag_x = int(cursor_pos.x() - pixmap.width() - offset)
 
-            parent_width, parent_height = parent_size
+        # If magnifier would go off screen bottom, move to top
+        if mag_y + pixmap.height() > parent_height:
+            mag_y = int(cursor_pos.y() - pixmap.height() - offset)
 
-            # If magnifier would go off screen right, move to left
-            if mag_x + self.width() > parent_width:
-                mag_x = int(cursor_pos.x() - self.width() - offset)
+        return pixmap, QPoint(mag_x, mag_y)
 
-            # If magnifier would go off screen bottom, move to top
-            if mag_y + self.height() > parent_height:
-                mag_y = int(cursor_pos.y() - self.height() - offset)
 
-            self.move(mag_x, mag_y)
-            self.show()
-            self.raise_()
+class MagnifierWidget(QWidget):
+    """
+    Reusable magnifier widget that shows 1:1 pixel view of image area under cursor.
 
+    KISS: Paints the cached pixmap and its border itself, no style sheet or layout work per update.
+    """
+
+    def __init__(self, parent=None, size: int = 150) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self._source = MagnifierSource(size)
+        self._pixmap: Optional[QPixmap] = None
+        # crop_serial of the source when the shown pixmap was last painted
+        self._shown_serial = -1
+        self._border_pen = QPen(MAGNIFIER_BORDER_COLOR, MAGNIFIER_BORDER_WIDTH)
+        self._raised = False
+        self._throttle = FrameThrottle(self._apply, self)
+        # Last: hide() can already deliver hideEvent, which uses the throttle
+        self.hide()
+
+    def set_source(self, image: Optional[Image.Image]) -> None:
+        """Convert ``image`` to the cached QImage up front (otherwise done on the first update)."""
+        self._source.set_source(image)
+
+    def set_pixmap(self, pixmap: QPixmap) -> None:
+        """Show ``pixmap``; repainted on the next event loop pass."""
+        self._pixmap = pixmap
+        if self.size() != pixmap.size():
+            self.resize(pixmap.size())
+        self.update()
+
+    def update_magnifier(
+        self,
+        cursor_pos: QPointF,
+        image: Image.Image,
+        image_rect: QRectF,
+        scale: float,
+        parent_size: tuple[int, int]
+    ) -> None:
+        """
+        Update magnifier position and content, coalesced to one refresh per frame.
+
+        Args:
+            cursor_pos: Current cursor position in parent coordinates
+            image: PIL Image to magnify
+            image_rect: Rectangle where image is displayed in parent
+            scale: Current display scale of image
+            parent_size: (width, height) of parent widget for boundary checking
+        """
+        self._throttle.request(QPointF(cursor_pos), image, QRectF(image_rect), scale, parent_size)
+
+    def _apply(
+        self,
+        cursor_pos: QPointF,
+        image: Image.Image,
+        image_rect: QRectF,
+        scale: float,
+        parent_size: tuple[int, int]
+    ) -> None:
+        try:
+            result = self._source.view(cursor_pos, image, image_rect, scale, parent_size)
         except Exception:
             # Fail Fast: Hide on any error
-            self.hide()
+            result = None
+        if result is None:
+            self._hide_and_forget()
+            return
+
+        pixmap, position = result
+        if self._pixmap is None or self._shown_serial != self._source.crop_serial:
+            # The source re-paints one pixmap in place: a new crop is the same object with new content
+            self._shown_serial = self._source.crop_serial
+            self.set_pixmap(pixmap)
+        self.move(position)
+        if not self.isVisible():
+            self.show()
+        if not self._raised:
+            # Siblings do not change while hovering, so stacking once is enough
+            self.raise_()
+            self._raised = True
+
+    def paintEvent(self, event) -> None:
+        if self._pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        # Border drawn inside the pixmap area
+        half = MAGNIFIER_BORDER_WIDTH / 2
+        painter.setPen(self._border_pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(QRectF(self.rect()).adjusted(half, half, -half, -half))
+
+    def hideEvent(self, event) -> None:
+        # A refresh still pending would show the magnifier again after an explicit hide()
+        self._throttle.cancel()
+        super().hideEvent(event)
+
+    def _hide_and_forget(self) -> None:
+        self._throttle.cancel()
+        self.hide()
+        self._source.forget()
+        self._pixmap = None
+        self._raised = False
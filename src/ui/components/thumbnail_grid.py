@@ -1,46 +1,214 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Set
+from itertools import islice
+from typing import Iterator, Optional, Set
+import os
 import subprocess
 
 from PySide6.QtWidgets import QListWidget, QListWidgetItem, QApplication, QMenu
-from PySide6.QtCore import Signal, Qt, QThread, QObject, QSize, QRect, QRectF, QTimer
-from PySide6.QtGui import QPixmap, QIcon, QAction
+from PySide6.QtCore import Signal, Qt, QEvent, QObject, QRunnable, QSize, QRect, QRectF, QThreadPool, QTimer
+from PySide6.QtGui import QColor, QIcon, QImage, QImageReader, QPixmap
 
 from ...core.thumbnail_cache import ThumbnailCache
+from ...core.image_files import scan_image_stats
 from ...core.image_metadata import extract_image_metadata
 from .magnifier_widget import MagnifierWidget
 from PIL import Image
 
-SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff", ".tif"}
+SUPPORTED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff", ".tif"})
 COMFY_START_SCRIPT = Path.home() / "_AA_ComfyUI" / "start-gui.sh"
+THUMBNAIL_WORKERS = min(8, os.cpu_count() or 1)
+EAGER_THUMBNAILS = 20  # Queued right away so the first screen fills without waiting for layout
+VISIBLE_MARGIN_PX = 300  # Pre-load band above and below the viewport
+VISIBLE_REFRESH_MS = 50
+POPULATE_CHUNK = 500  # Items inserted per event-loop pass while filling large folders
+ICON_FLUSH_MS = 50  # Finished thumbnails are installed in batches, one repaint per batch
+# Pool priority of a thumbnail: on-screen rows first, then smaller files (they decode fastest)
+PRIORITY_VISIBLE_BONUS = 1 << 21
+PRIORITY_MAX_SIZE_KB = 1 << 20
+SIZE_ROLE = Qt.UserRole + 1
 
 
 class ThumbnailLoader(QObject):
-    """Background thread worker for thumbnail generation."""
-    thumbnail_ready = Signal(Path, QPixmap)
+    """Signal hub for background grid tasks; lives in the GUI thread so results arrive there."""
+    # generation, row, scaled thumbnail
+    thumbnail_ready = Signal(int, int, QImage)
+    # generation, row: task dropped because its row left the pre-load band before it ran
+    thumbnail_skipped = Signal(int, int)
+    # generation, sorted (image path, file size) pairs
+    directory_scanned = Signal(int, list)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        # Cancellation token: bumped by the grid per listing; tasks of older listings exit early
+        self.generation = 0
+        # First and last row of the viewport plus pre-load band, set by the grid on scroll.
+        # Queued tasks outside it are skipped, so fast scrolling does not decode every passed row.
+        self.wanted_rows = (0, EAGER_THUMBNAILS - 1)
+
+
+def sort_images(
+    images: list[Path],
+    mode: str,
+    mtimes: Optional[dict[Path, float]] = None,
+    resolutions: Optional[dict[tuple[Path, float], int]] = None,
+) -> list[Path]:
+    """
+    Sort images for the grid: "name" (A-Z), "date" (newest first) or "resolution" (largest first).
+
+    ``mtimes`` supplies already known modification times for the date sort. ``resolutions``
+    caches pixel counts by (path, mtime) across calls; it is filled in as headers are read.
+    """
+    if mode == "date":
+        # Newest first (highest mtime first)
+        def get_mtime(path: Path) -> float:
+            if mtimes is not None and path in mtimes:
+                return mtimes[path]
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+        return sorted(images, key=get_mtime, reverse=True)
+    elif mode == "resolution":
+        # Highest resolution first (width * height); QImageReader reads the header only
+        def get_resolution(path: Path) -> int:
+            key = (path, mtimes.get(path, 0.0)) if mtimes is not None else None
+            if resolutions is not None and key is not None and key in resolutions:
+                return resolutions[key]
+            size = QImageReader(str(path)).size()
+            pixels = size.width() * size.height() if size.isValid() else 0
+            if resolutions is not None and key is not None:
+                resolutions[key] = pixels
+            return pixels
+        return sorted(images, key=get_resolution, reverse=True)
+    else:
+        # "name" and fallback: alphabetically
+        return sorted(images, key=lambda p: p.name.lower())
+
+
+class DirectoryScanTask(QRunnable):
+    """
+    List and sort a folder's images on a pool thread.
+
+    Listing, stat() for the date sort and header reads for the resolution sort all touch the
+    disk, which can block for seconds on network mounts; the GUI thread only gets the result.
+    """
 
-    def __init__(self, cache: ThumbnailCache) -> None:
+    def __init__(
+        self,
+        loader: ThumbnailLoader,
+        directory: Path,
+        sort_mode: str,
+        generation: int,
+        resolutions: Optional[dict[tuple[Path, float], int]] = None,
+    ) -> None:
         super().__init__()
-        self.cache = cache
+        self.loader = loader
+        self.directory = directory
+        self.sort_mode = sort_mode
+        self.generation = generation
+        self.resolutions = resolutions
+
+    def run(self) -> None:
+        if self.generation != self.loader.generation:
+            return
+        try:
+            stats = scan_image_stats(self.directory, SUPPORTED_EXTENSIONS)
+        except OSError:
+            stats = []
+
+        # Listed with their stat: size sets the decode priority, mtime serves the date sort
+        # and keys the resolution cache
+        sizes = {path: info.st_size for path, info in stats}
+        mtimes = {path: info.st_mtime for path, info in stats}
+        order = sort_images(list(sizes), self.sort_mode, mtimes, self.resolutions)
+        entries = [(path, sizes[path]) for path in order]
 
-    def load_thumbnail(self, image_path: Path) -> None:
-        """Load or generate thumbnail in background."""
         try:
-            # Get or create thumbnail
-            thumb_path = self.cache.get_or_create_thumbnail(image_path)
+            self.loader.directory_scanned.emit(self.generation, entries)
+        except RuntimeError:
+            # Grid (and its loader) already destroyed, e.g. during shutdown
+            pass
+
 
-            if thumb_path and thumb_path.exists():
-                # Load pixmap
-                pixmap = QPixmap(str(thumb_path))
-                if not pixmap.isNull():
-                    self.thumbnail_ready.emit(image_path, pixmap)
+class ThumbnailTask(QRunnable):
+    """
+    Decode and scale one thumbnail on a pool thread.
 
+    Works with QImage only: QPixmap must not be created outside the GUI thread.
+    """
+
+    def __init__(
+        self,
+        loader: ThumbnailLoader,
+        cache: ThumbnailCache,
+        image_path: Path,
+        row: int,
+        generation: int,
+        size: QSize,
+    ) -> None:
+        super().__init__()
+        self.loader = loader
+        self.cache = cache
+        self.image_path = image_path
+        self.row = row
+        self.generation = generation
+        self.size = size
+
+    def run(self) -> None:
+        if self.generation != self.loader.generation:
+            # Folder changed while this task was waiting
+            return
+        first, last = self.loader.wanted_rows
+        if not first <= self.row <= last:
+            # Scrolled away while waiting; the grid queues the row again when it comes back
+            try:
+                self.loader.thumbnail_skipped.emit(self.generation, self.row)
+            except RuntimeError:
+                pass
+            return
+        image = QImage()
+        try:
+            thumb_path = self.cache.get_or_create_thumbnail(self.image_path)
+            if thumb_path:
+                image = QImage(str(thumb_path))
+            if image.isNull():
+                # Formats the cache cannot thumbnail: decode the original instead
+                image = self._read_original()
+            if not image.isNull():
+                image = self._fit_cell(image)
         except Exception:
-            # Fail Fast: Silently skip failed thumbnails
+            # Fail Fast: Silently skip failed thumbnails, the placeholder stays
+            image = QImage()
+
+        try:
+            self.loader.thumbnail_ready.emit(self.generation, self.row, image)
+        except RuntimeError:
+            # Grid (and its loader) already destroyed, e.g. during shutdown
             pass
 
+    def _fit_cell(self, image: QImage) -> QImage:
+        """Scale to the cell; large sources drop to 2x cell size with a fast pass first."""
+        target = image.size().scaled(self.size, Qt.KeepAspectRatio)
+        if image.size() == target:
+            return image
+        if image.width() >= 2 * target.width() and image.height() >= 2 * target.height():
+            # Nearest-neighbour to twice the target, then the smooth pass only covers 4x the cell's pixels
+            image = image.scaled(target * 2, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        return image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+    def _read_original(self) -> QImage:
+        """Decode the source at cell size; JPEG scales inside the decoder instead of after a full decode."""
+        reader = QImageReader(str(self.image_path))
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid() and (
+            source_size.width() > self.size.width() or source_size.height() > self.size.height()
+        ):
+            reader.setScaledSize(source_size.scaled(self.size, Qt.KeepAspectRatio))
+        return reader.read()
+
 
 class ThumbnailGridView(QListWidget):
     """
@@ -54,6 +222,17 @@ class ThumbnailGridView(QListWidget):
     image_selected = Signal(Path)
     magnifier_started = Signal()
     magnifier_stopped = Signal()
+    # Number of image files found, once the background scan of a folder finishes
+    directory_loaded = Signal(int)
+    # Items inserted so far / total files in the folder being loaded
+    loading_progress = Signal(int, int)
+
+    # One grey icon shared by every placeholder item of every grid (built on first use,
+    # a QPixmap needs the QApplication); items only hold implicitly shared references
+    _placeholder_icon: Optional[QIcon] = None
+    # Thumbnail cache shared by all grids (the gallery and the sidebar browser); it only holds
+    # settings, so the tasks of several grids can use it from pool threads at the same time
+    _shared_cache: Optional[ThumbnailCache] = None
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
@@ -61,10 +240,47 @@ class ThumbnailGridView(QListWidget):
         # Sort mode: "name", "date", "resolution"
         self.sort_mode = "date"
 
-        self.cache = ThumbnailCache()
+        if ThumbnailGridView._shared_cache is None:
+            ThumbnailGridView._shared_cache = ThumbnailCache()
+        self.cache = ThumbnailGridView._shared_cache
         self.current_directory: Optional[Path] = None
-        self._item_paths: dict[int, Path] = {}  # Map item index to Path
-        self._loading_threads: list[QThread] = []
+
+        # Background thumbnail decoding; results from an older load_directory call are dropped
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(THUMBNAIL_WORKERS)
+        self._loader = ThumbnailLoader(self)
+        self._loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._loader.thumbnail_skipped.connect(self._on_thumbnail_skipped)
+        self._loader.directory_scanned.connect(self._on_directory_scanned)
+        self._pending_icons: list[tuple[int, QImage]] = []
+        self._icon_timer = QTimer(self)
+        self._icon_timer.setSingleShot(True)
+        self._icon_timer.setInterval(ICON_FLUSH_MS)
+        self._icon_timer.timeout.connect(self._flush_icons)
+        self._generation = 0
+        # (directory, st_mtime_ns, image count) of the shown listing; count is None while scanning.
+        # Re-opening an unchanged folder keeps the grid instead of listing it again.
+        self._last_load: Optional[tuple[Path, int, Optional[int]]] = None
+        # Metadata tooltips are read on first hover, not for every file on load
+        self._tooltip_cache: dict[Path, str] = {}
+        # Pixel counts by (path, mtime): switching back to the resolution sort reads no headers
+        self._resolution_cache: dict[tuple[Path, float], int] = {}
+        self._queued_rows: Set[int] = set()
+        # Thumbnails are only decoded for rows near the viewport; scrolling queues more
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(VISIBLE_REFRESH_MS)
+        self._visible_timer.timeout.connect(self._refresh_visible_thumbs)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_visible_refresh)
+
+        # Large folders are inserted in chunks so input and painting keep running in between
+        self._pending_entries: Optional[Iterator[tuple[Path, int]]] = None
+        self._pending_done = 0
+        self._pending_total = 0
+        self._populate_timer = QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.setInterval(0)
+        self._populate_timer.timeout.connect(self._populate_chunk)
 
         # Setup grid view (4x3-ish cells, responsive)
         self.cell_size = QSize(260, 200)
@@ -79,6 +295,11 @@ class ThumbnailGridView(QListWidget):
         self.setWordWrap(True)
         self.setStyleSheet("QListWidget { background: #f9f9f9; }")
 
+        if ThumbnailGridView._placeholder_icon is None:
+            placeholder = QPixmap(self.cell_size)
+            placeholder.fill(QColor("#e0e0e0"))
+            ThumbnailGridView._placeholder_icon = QIcon(placeholder)
+
         # Enable tooltips
         self.setMouseTracking(True)
 
@@ -89,114 +310,240 @@ class ThumbnailGridView(QListWidget):
         self._pending_pos = None
         self._magnifier_active = False
         self._active_item = None
+        self._magnifier_source: Optional[tuple[Path, Image.Image]] = None
+
+        # Context menu built once; actions act on the item that was right-clicked
+        self._context_target: Optional[Path] = None
+        self._context_menu = QMenu(self)
+        show_in_fm_action = self._context_menu.addAction("Im Dateimanager anzeigen")
+        show_in_fm_action.triggered.connect(self._on_show_in_file_manager)
+        self._open_comfy_action = self._context_menu.addAction("In ComfyUI laden")
+        self._open_comfy_action.triggered.connect(self._on_open_in_comfyui)
 
         # Connect signals
         self.itemClicked.connect(self._on_item_clicked)
 
-    def load_directory(self, directory: Path) -> int:
+    def load_directory(self, directory: Path) -> None:
         """
         Load all images from directory and display thumbnails.
 
-        KISS: Simple synchronous loading (no cache).
+        Returns immediately: the folder is listed and sorted on the thread pool, then
+        ``directory_loaded`` reports the image count. Items appear with a placeholder icon,
+        the first chunk at once and the rest in later event-loop passes; thumbnails are
+        filled in from the thread pool, metadata tooltips on first hover.
+
+        If the folder's mtime has not changed since the last load the grid is kept as is;
+        ``reload()`` forces a new listing.
         """
-        if not directory.exists() or not directory.is_dir():
-            return 0
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        last = self._last_load
+        if mtime_ns is not None and last is not None and last[:2] == (directory, mtime_ns):
+            count = last[2]
+            if count is None or self._pending_entries is not None:
+                # Listing of this folder still in progress; it reports directory_loaded itself
+                return
+            if self.count() == count:
+                self.directory_loaded.emit(count)
+                return
 
+        if directory != self.current_directory:
+            self._tooltip_cache.clear()
+            self._resolution_cache.clear()
         self.current_directory = directory
         self.clear()
-        self._item_paths.clear()
+        self._last_load = (directory, mtime_ns, None) if mtime_ns is not None else None
+
+        self._pool.start(DirectoryScanTask(
+            self._loader, directory, self.sort_mode, self._generation, self._resolution_cache
+        ))
+
+    def clear(self) -> None:
+        """Remove all items and cancel the background work queued for them."""
+        # Queued tasks are dropped; running ones are ignored via the generation
+        self._pool.clear()
+        self._generation += 1
+        self._loader.generation = self._generation
+        self._populate_timer.stop()
+        self._pending_entries = None
+        self._queued_rows.clear()
+        self._pending_icons.clear()
+        self._icon_timer.stop()
+        self._last_load = None
+        self._loader.wanted_rows = (0, EAGER_THUMBNAILS - 1)
+        super().clear()
+
+    def _on_directory_scanned(self, generation: int, entries: list) -> None:
+        """Start filling the grid with a finished folder listing (GUI thread)."""
+        if generation != self._generation:
+            return
+        if self._last_load is not None:
+            self._last_load = (self._last_load[0], self._last_load[1], len(entries))
+        self.directory_loaded.emit(len(entries))
 
-        # Collect all image files by explicit extension search
-        all_images: list[Path] = []
-        for ext in SUPPORTED_EXTENSIONS:
-            try:
-                all_images.extend(directory.glob(f"*{ext}"))
-                all_images.extend(directory.glob(f"*{ext.upper()}"))
-            except Exception:
-                pass
+        self._pending_entries = iter(entries)
+        self._pending_done = 0
+        self._pending_total = len(entries)
+        self._populate_chunk()
 
-        # Deduplicate and sort according to current sort mode
-        all_images = list(set(all_images))
-        all_images = self._sort_images(all_images)
+        for row in range(min(EAGER_THUMBNAILS, self.count())):
+            self._queue_thumbnail(row)
 
-        count = 0
-        for path in all_images:
+    def _populate_chunk(self) -> None:
+        """Insert the next POPULATE_CHUNK items and reschedule while files remain."""
+        if self._pending_entries is None:
+            return
+        for path, size in islice(self._pending_entries, POPULATE_CHUNK):
+            self._pending_done += 1
             try:
-                self._add_thumbnail_item(path)
-                count += 1
+                self._add_thumbnail_item(path, size)
             except Exception:
                 pass
 
-        return count
-
-    def _sort_images(self, images: list[Path]) -> list[Path]:
-        """Sort images according to current sort mode."""
-        if self.sort_mode == "name":
-            # A-Z alphabetically
-            return sorted(images, key=lambda p: p.name.lower())
-        elif self.sort_mode == "date":
-            # Newest first (highest mtime first)
-            return sorted(images, key=lambda p: p.stat().st_mtime, reverse=True)
-        elif self.sort_mode == "resolution":
-            # Highest resolution first (width * height)
-            def get_resolution(path: Path) -> int:
-                try:
-                    pixmap = QPixmap(str(path))
-                    if not pixmap.isNull():
-                        return pixmap.width() * pixmap.height()
-                except Exception:
-                    pass
-                return 0
-            return sorted(images, key=get_resolution, reverse=True)
+        self.loading_progress.emit(self._pending_done, self._pending_total)
+        if self._pending_done < self._pending_total:
+            self._populate_timer.start()
         else:
-            # Fallback: alphabetically
-            return sorted(images, key=lambda p: p.name.lower())
+            self._pending_entries = None
+        self._schedule_visible_refresh()
 
     def set_sort_mode(self, mode: str) -> None:
         """Change sort mode and reload directory."""
         if mode not in ("name", "date", "resolution"):
             return
         self.sort_mode = mode
+        self.reload()
+
+    def reload(self) -> None:
+        """List the current directory again, even if it looks unchanged."""
+        self.invalidate()
         if self.current_directory:
             self.load_directory(self.current_directory)
 
-    def _add_thumbnail_item(self, image_path: Path) -> None:
-        """Add thumbnail item to grid (sync load, no cache)."""
-        item = QListWidgetItem(image_path.name)
-        item.setTextAlignment(Qt.AlignCenter)
+    def invalidate(self) -> None:
+        """Make the next load_directory re-read the folder (e.g. after overwriting a file in it)."""
+        self._last_load = None
+        # Size, dimensions and date in the hover tooltips may be outdated as well
+        self._tooltip_cache.clear()
 
-        try:
-            metadata = extract_image_metadata(image_path)
-            item.setToolTip(metadata.to_tooltip_html())
-        except Exception:
-            item.setToolTip(image_path.name)
+    def _add_thumbnail_item(self, image_path: Path, file_size: int = 0) -> None:
+        """Add placeholder item to grid; its thumbnail is queued once it scrolls into view."""
+        item = QListWidgetItem(self._placeholder_icon, image_path.name)
+        item.setTextAlignment(Qt.AlignCenter)
+        item.setToolTip(image_path.name)
+        # Path travels with the item: no row lookup (a linear scan in QListWidget) to find it again
+        item.setData(Qt.UserRole, str(image_path))
+        item.setData(SIZE_ROLE, file_size)
 
-        pixmap = None
-        try:
-            pixmap = QPixmap(str(image_path))
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(
-                    self.cell_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-        except Exception:
-            pixmap = None
+        self.addItem(item)
 
-        if pixmap and not pixmap.isNull():
-            item.setIcon(QIcon(pixmap))
+    def _queue_thumbnail(self, row: int, visible: bool = True) -> None:
+        if row in self._queued_rows:
+            return
+        item = self.item(row)
+        image_path = self._path_for_item(item) if item is not None else None
+        if image_path is None:
+            return
+        self._queued_rows.add(row)
+        # Smallest files first so most cells fill while a few large outliers still decode
+        size_kb = min((item.data(SIZE_ROLE) or 0) >> 10, PRIORITY_MAX_SIZE_KB)
+        priority = (PRIORITY_VISIBLE_BONUS if visible else 0) - size_kb
+        self._pool.start(
+            ThumbnailTask(self._loader, self.cache, image_path, row, self._generation, self.cell_size),
+            priority,
+        )
+
+    def _schedule_visible_refresh(self, *_args) -> None:
+        # Restart without arguments: QTimer.start(int) would take a scroll value as the interval
+        self._visible_timer.start()
+
+    def _refresh_visible_thumbs(self) -> None:
+        """Queue thumbnails for rows within the viewport plus the pre-load margin."""
+        count = self.count()
+        if count == 0:
+            return
+        viewport = self.viewport().rect()
+        area = viewport.adjusted(0, -VISIBLE_MARGIN_PX, 0, VISIBLE_MARGIN_PX)
+
+        # Rows flow left-to-right, top-to-bottom, so their rects are ordered by y: bisect for the first
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            if self.visualItemRect(self.item(mid)).bottom() < area.top():
+                low = mid + 1
+            else:
+                high = mid
+        last = low - 1
+        for row in range(low, count):
+            rect = self.visualItemRect(self.item(row))
+            if rect.top() > area.bottom():
+                break
+            last = row
+            self._queue_thumbnail(row, visible=rect.intersects(viewport))
+        self._loader.wanted_rows = (low, last)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        # Re-wrapping changes which rows are visible
+        self._schedule_visible_refresh()
+
+    def _on_thumbnail_skipped(self, generation: int, row: int) -> None:
+        if generation == self._generation:
+            self._queued_rows.discard(row)
+
+    def _on_thumbnail_ready(self, generation: int, row: int, image: QImage) -> None:
+        """Collect a finished thumbnail (GUI thread); installed with the next batch."""
+        if generation != self._generation or image.isNull():
+            return
+        self._pending_icons.append((row, image))
+        if not self._icon_timer.isActive():
+            self._icon_timer.start()
 
-        self.addItem(item)
-        # Store path using item's current index
-        item_index = self.row(item)
-        self._item_paths[item_index] = image_path
+    def _flush_icons(self) -> None:
+        """Install all collected thumbnails with updates suspended, then repaint once."""
+        if not self._pending_icons:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for row, image in self._pending_icons:
+                item = self.item(row)
+                if item is not None:
+                    item.setIcon(QIcon(QPixmap.fromImage(image)))
+        finally:
+            self._pending_icons.clear()
+            self.setUpdatesEnabled(True)
+        self.viewport().update()
+
+    def viewportEvent(self, event) -> bool:
+        if event.type() == QEvent.ToolTip:
+            # Fill in the metadata tooltip just before Qt shows it
+            item = self.itemAt(event.pos())
+            if item is not None:
+                self._resolve_tooltip(item)
+        return super().viewportEvent(event)
+
+    def _resolve_tooltip(self, item: QListWidgetItem) -> None:
+        image_path = self._path_for_item(item)
+        if image_path is None:
+            return
+        tooltip = self._tooltip_cache.get(image_path)
+        if tooltip is None:
+            try:
+                tooltip = extract_image_metadata(image_path).to_tooltip_html()
+            except Exception:
+                tooltip = image_path.name
+            self._tooltip_cache[image_path] = tooltip
+        if item.toolTip() != tooltip:
+            item.setToolTip(tooltip)
 
     def _on_item_clicked(self, item: QListWidgetItem) -> None:
         """Handle thumbnail click."""
         image_path = self._path_for_item(item)
 
-        if image_path and image_path.exists():
-            # Emit signal
+        # Paths come from the directory scan; the consumer reports files deleted since then
+        if image_path is not None:
             self.image_selected.emit(image_path)
 
     def contextMenuEvent(self, event) -> None:
@@ -208,25 +555,30 @@ class ThumbnailGridView(QListWidget):
 
         # Get path from mapping
         image_path = self._path_for_item(item)
-        if not image_path or not image_path.exists():
+        if image_path is None:
             return
 
-        # Create context menu
-        menu = QMenu(self)
-        show_in_fm_action = QAction("Im Dateimanager anzeigen", self)
-        show_in_fm_action.triggered.connect(lambda: self._show_in_file_manager(image_path))
-        menu.addAction(show_in_fm_action)
+        self._open_comfy_action.setVisible(COMFY_START_SCRIPT.exists())
 
-        if COMFY_START_SCRIPT.exists():
-            open_comfy_action = QAction("In ComfyUI laden", self)
-            open_comfy_action.triggered.connect(lambda: self._open_in_comfyui(image_path))
-            menu.addAction(open_comfy_action)
+        # Show menu at cursor position; exec() returns after the chosen action has run
+        self._context_target = image_path
+        try:
+            self._context_menu.exec(event.globalPos())
+        finally:
+            self._context_target = None
 
-        # Show menu at cursor position
-        menu.exec(event.globalPos())
+    def _on_show_in_file_manager(self) -> None:
+        if self._context_target is not None:
+            self._show_in_file_manager(self._context_target)
+
+    def _on_open_in_comfyui(self) -> None:
+        if self._context_target is not None:
+            self._open_in_comfyui(self._context_target)
 
     def _show_in_file_manager(self, image_path: Path) -> None:
         """Open system file manager with image's directory."""
+        if not image_path.parent.is_dir():
+            return
         try:
             # Open parent directory in file manager
             subprocess.Popen(['xdg-open', str(image_path.parent)])
@@ -236,6 +588,8 @@ class ThumbnailGridView(QListWidget):
 
     def _open_in_comfyui(self, image_path: Path) -> None:
         """Launch ComfyUI GUI with the image preloaded (if available)."""
+        if not image_path.is_file():
+            return
         try:
             subprocess.Popen([str(COMFY_START_SCRIPT), "--load-image", str(image_path)])
         except Exception:
@@ -244,8 +598,8 @@ class ThumbnailGridView(QListWidget):
 
     def _path_for_item(self, item: QListWidgetItem) -> Optional[Path]:
         """Return filesystem path for a QListWidgetItem."""
-        item_index = self.row(item)
-        return self._item_paths.get(item_index)
+        path = item.data(Qt.UserRole)
+        return Path(path) if path else None
 
     def path_for_item(self, item: QListWidgetItem) -> Optional[Path]:
         """Public helper for consumers needing the mapped path."""
@@ -313,7 +667,7 @@ class ThumbnailGridView(QListWidget):
 
         # Get image path
         image_path = self._path_for_item(item)
-        if not image_path or not image_path.exists():
+        if image_path is None:
             self.magnifier.hide()
             return
 
@@ -321,8 +675,10 @@ class ThumbnailGridView(QListWidget):
         item_rect = self.visualItemRect(item)
 
         try:
-            # Load original image
-            pil_image = Image.open(image_path)
+            # Load original image (kept while the cursor stays on the same item)
+            if self._magnifier_source is None or self._magnifier_source[0] != image_path:
+                self._magnifier_source = (image_path, Image.open(image_path))
+            pil_image = self._magnifier_source[1]
 
             # Calculate scale: thumbnail fits within item_rect
             scale_x = item_rect.width() / pil_image.width
@@ -361,5 +717,6 @@ class ThumbnailGridView(QListWidget):
         self._pending_item = None
         self._magnifier_active = False
         self._active_item = None
+        self._magnifier_source = None
         self.magnifier_stopped.emit()
         super().leaveEvent(event)
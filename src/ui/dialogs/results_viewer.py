@@ -17,12 +17,19 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
 )
 
+from ..components.magnifier_widget import FrameThrottle, MagnifierSource, crop_box
+
 
 def pil_to_qpixmap(pil_image: Image.Image) -> QPixmap:
-    """Convert PIL Image to QPixmap."""
-    img_rgb = pil_image.convert("RGB")
-    data = img_rgb.tobytes("raw", "RGB")
-    qimage = QImage(data, img_rgb.width, img_rgb.height, img_rgb.width * 3, QImage.Format_RGB888)
+    """Convert PIL Image to QPixmap (RGB and RGBA without an intermediate converted copy)."""
+    if pil_image.mode == "RGBA":
+        image, fmt, channels = pil_image, QImage.Format_RGBA8888, 4
+    else:
+        image = pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB")
+        fmt, channels = QImage.Format_RGB888, 3
+    # QImage only borrows the buffer; fromImage copies it while ``data`` is still referenced
+    data = image.tobytes("raw", image.mode)
+    qimage = QImage(data, image.width, image.height, image.width * channels, fmt)
     return QPixmap.fromImage(qimage)
 
 
@@ -84,6 +91,12 @@ class ResultsViewerDialog(QDialog):
         self.magnifier_active = False
         self.current_hover_thumbnail: Optional[ImageThumbnail] = None
         self.magnifier_label: Optional[QLabel] = None
+        self._mag_visible = False
+        # Hovered images kept as RGB QImages; per-move crops then skip PIL convert/tobytes, and
+        # switching between the original and one export does not convert either again
+        self._magnifier_source = MagnifierSource(size=400, kept_sources=2)
+        # At most one magnifier refresh per frame; moves in between only replace the pending position
+        self._mag_throttle = FrameThrottle(self._update_magnifier, self)
 
         self._setup_ui()
 
@@ -170,16 +183,19 @@ class ResultsViewerDialog(QDialog):
         """Mouse leaves thumbnail - hide magnifier."""
         self.magnifier_active = False
         self.current_hover_thumbnail = None
+        self._mag_throttle.cancel()
         if self.magnifier_label:
             self.magnifier_label.hide()
+        self._mag_visible = False
+        self._magnifier_source.forget()
 
     def _on_mouse_move(self, event, thumbnail: ImageThumbnail) -> None:
-        """Mouse moves over thumbnail - update magnifier."""
+        """Mouse moves over thumbnail - update magnifier, coalesced to one refresh per frame."""
         if not self.magnifier_active or not thumbnail.pil_image or not self.magnifier_label:
             return
+        self._mag_throttle.request(QPoint(event.pos()), QPoint(event.globalPos()), thumbnail)
 
-        # Get mouse position relative to thumbnail
-        local_pos = event.pos()
+    def _update_magnifier(self, local_pos: QPoint, global_pos: QPoint, thumbnail: ImageThumbnail) -> None:
 
         # Calculate which part of the original image to show
         thumb_rect = thumbnail.pixmap().rect() if thumbnail.pixmap() else QRect()
@@ -198,26 +214,15 @@ class ResultsViewerDialog(QDialog):
         crop_size = mag_size  # Show 1:1 scale (100%)
 
         # Calculate crop region
-        left = max(0, center_x - crop_size // 2)
-        top = max(0, center_y - crop_size // 2)
-        right = min(thumbnail.pil_image.width, left + crop_size)
-        bottom = min(thumbnail.pil_image.height, top + crop_size)
-
-        # Adjust if we hit image boundaries
-        if right - left < crop_size:
-            left = max(0, right - crop_size)
-        if bottom - top < crop_size:
-            top = max(0, bottom - crop_size)
+        box = crop_box(center_x, center_y, crop_size, thumbnail.pil_image.width, thumbnail.pil_image.height)
 
         # Crop and display
         try:
-            cropped = thumbnail.pil_image.crop((left, top, right, bottom))
-            pixmap = pil_to_qpixmap(cropped)
+            pixmap = self._magnifier_source.crop(thumbnail.pil_image, box)
             self.magnifier_label.setPixmap(pixmap)
             self.magnifier_label.resize(pixmap.size())
 
             # Position magnifier near cursor
-            global_pos = event.globalPos()
             dialog_pos = self.mapFromGlobal(global_pos)
 
             # Offset magnifier to the right and below cursor
@@ -235,8 +240,11 @@ class ResultsViewerDialog(QDialog):
                 mag_y = dialog_pos.y() - self.magnifier_label.height() - offset_y
 
             self.magnifier_label.move(mag_x, mag_y)
-            self.magnifier_label.show()
-            self.magnifier_label.raise_()
+            if not self._mag_visible:
+                # Stack and show once per hover; later moves only reposition and swap the pixmap
+                self.magnifier_label.show()
+                self.magnifier_label.raise_()
+                self._mag_visible = True
 
         except Exception:
             pass  # Silently ignore crop errors
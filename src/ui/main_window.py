@@ -40,6 +40,7 @@ from ..core.adjustments import (
 )
 from ..core.adjustment_controller import AdjustmentController
 from ..core.image_session import ImageSession, ImageSessionError
+from ..core.image_files import scan_image_files
 from ..core.image_store import ImageStore, ImageState
 from ..core.crop_service import compute_crop_box, perform_crop, CropServiceError
 from ..core.image_processing import ProcessingPipeline, ProcessingError, ProcessingConfig
@@ -54,7 +55,7 @@ from .controllers.zoom_controller import ZoomController
 from .views.image_canvas import ImageCanvas
 from .components.thumbnail_grid import ThumbnailGridView
 
-SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff"}
+SUPPORTED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff"})
 
 
 class MainWindow(QMainWindow):
@@ -94,6 +95,7 @@ class MainWindow(QMainWindow):
         self.current_image_path: Path | None = None
         self.current_folder: Path | None = None
         self.current_adjusted_image: Image.Image | None = None
+        self._preview_pending = False  # canvas shows a downscaled preview, full-res render outstanding
         self.metadata_text = ""
         self.metadata_dirty = False
         self.loaded_metadata: dict[str, str] = {}
@@ -273,6 +275,7 @@ class MainWindow(QMainWindow):
         self.gallery_grid.itemDoubleClicked.connect(self._open_image_from_gallery_item)
         self.gallery_grid.magnifier_started.connect(self._hide_info_dialog)
         self.gallery_grid.magnifier_stopped.connect(self._maybe_auto_show_info)
+        self.gallery_grid.directory_loaded.connect(self._on_gallery_directory_loaded)
 
         gallery_toolbar = QHBoxLayout()
         gallery_toolbar.setContentsMargins(0, 0, 0, 0)
@@ -782,7 +785,7 @@ class MainWindow(QMainWindow):
             self._is_loading = False
             return
         self.current_folder = path.parent
-        self.current_adjusted_image = image.copy()
+        self.current_adjusted_image = image
         self.canvas.display_pil_image(image)
         self.zoom_controller.reset()
         self.zoom_controller.set_enabled(True)
@@ -1056,10 +1059,13 @@ class MainWindow(QMainWindow):
             return
 
         self.current_adjusted_image = adjusted
+        self._preview_pending = False
         self.canvas.display_pil_image(adjusted)
         self._enable_save_buttons(True)
 
     def _commit_current_state(self, description: str) -> None:
+        if self._preview_pending:
+            self._render_adjusted_image()
         if not self.current_adjusted_image:
             return
         self._push_state(description, self.current_adjusted_image)
@@ -1081,7 +1087,7 @@ class MainWindow(QMainWindow):
                         "sharpness": snapshot.sharpness,
                         "temperature": snapshot.temperature,
                     },
-                    "current_image": image.copy(),
+                    "current_image": image,
                     "metadata_text": self.metadata_text,
                     "crop_geometry": self.crop_geometry.to_payload() if self.crop_geometry else None,
                 },
@@ -1092,15 +1098,29 @@ class MainWindow(QMainWindow):
     def _on_adjustment_state_change(self, state: AdjustmentState) -> None:
         if not self.session.has_image():
             return
+        if self._is_adjustment_slider_down():
+            # While dragging only the downscaled preview is adjusted; release commits full resolution.
+            try:
+                preview = self.session.apply_adjustments_preview(state)
+            except ImageSessionError as exc:
+                self._show_error(str(exc))
+                return
+            self._preview_pending = True
+            self.canvas.display_pil_image(preview)
+            return
         try:
             adjusted = self.session.apply_adjustments(state)
         except ImageSessionError as exc:
             self._show_error(str(exc))
             return
         self.current_adjusted_image = adjusted
+        self._preview_pending = False
         self.canvas.display_pil_image(adjusted)
         self._enable_save_buttons(True)
 
+    def _is_adjustment_slider_down(self) -> bool:
+        return any(isinstance(widget, QSlider) and widget.isSliderDown() for widget in self.adjustment_controls)
+
     def _on_factor_slider_change(self, field: str, title: str, value: int, label: QLabel) -> None:
         factor = self._slider_to_factor(value)
         label.setText(f"{factor:.2f}")
@@ -1266,28 +1286,30 @@ class MainWindow(QMainWindow):
 
         self._gallery_current_directory = directory
         should_load = load if load is not None else self.view_mode == "gallery"
-        count = 0
+        self._gallery_image_count = 0
         if should_load:
-            # Show loading message
+            # Show loading message; the grid lists the folder in the background
+            # and reports the count through directory_loaded
             self._append_status(">>> Bitte warten, Bilder werden geladen...")
             self.status_bar.showMessage("Galerie wird geladen...", 0)
-            QApplication.processEvents()  # Force UI update
 
             try:
-                count = self.gallery_grid.load_directory(directory)
-                self._append_status(f">>> Fertig: {count} Bilder geladen")
-                self.status_bar.clearMessage()
+                self.gallery_grid.load_directory(directory)
             except Exception as exc:
                 import traceback
                 self._append_status(f"✗ Galerie konnte nicht geladen werden: {exc}")
                 self._append_status(traceback.format_exc())
                 self.status_bar.showMessage(f"Fehler beim Laden: {exc}", 5000)
-                count = 0
 
-        self._gallery_image_count = count
         self.delete_selected_btn.setEnabled(False)
         self.gallery_grid.viewport().update()
 
+    def _on_gallery_directory_loaded(self, count: int) -> None:
+        """Background folder scan of the gallery finished."""
+        self._gallery_image_count = count
+        self._append_status(f">>> Fertig: {count} Bilder geladen")
+        self.status_bar.clearMessage()
+
     def _set_gallery_sort(self, mode: str) -> None:
         """Change gallery sort mode and update button states."""
         # Update button states (only one checked at a time)
@@ -1695,6 +1717,7 @@ class MainWindow(QMainWindow):
         self.has_ratio_selection = False
         self.session = ImageSession(self.settings)
         self.current_adjusted_image = None
+        self._preview_pending = False
         self.crop_geometry = None
         self.view_mode = "single"
         self.current_folder = None
@@ -1822,7 +1845,7 @@ class MainWindow(QMainWindow):
     def _restore_from_payload(self, payload: dict) -> None:
         base = payload.get("base_image")
         if base is not None:
-            self.session.set_base_image(base.copy())
+            self.session.set_base_image(base)
             self._set_adjustment_controls_enabled(True)
         else:
             self.session = ImageSession(self.settings)
@@ -1844,7 +1867,7 @@ class MainWindow(QMainWindow):
 
         current = payload.get("current_image")
         if current:
-            self.current_adjusted_image = current.copy()
+            self.current_adjusted_image = current
             self.canvas.display_pil_image(self.current_adjusted_image)
         else:
             self.current_adjusted_image = None
@@ -1956,16 +1979,18 @@ class MainWindow(QMainWindow):
         metadata_dict = self._parse_metadata_text()
         metadata_bytes = self._metadata_to_xmp(metadata_dict)
 
-        variants: list[ExportVariant] = []
         for idx, (prefix, target_width, target_height) in enumerate(specs, 1):
             if target_width == adjusted.width and target_height == adjusted.height:
                 self._append_status(f"  [{idx}/{len(specs)}] Original {target_width}x{target_height} (Prefix: '{prefix}')")
-                variant_img = adjusted.copy()
             else:
                 self._append_status(f"  [{idx}/{len(specs)}] Resize → {target_width}x{target_height} (Prefix: '{prefix}')...")
-                variant_img = self.processing_pipeline.resize_with_quality(
-                    adjusted, target_width=target_width, target_height=target_height
-                )
+        # Smaller variants are downscaled from the next larger one instead of the full image.
+        variant_images = self.processing_pipeline.resize_ladder(
+            adjusted, [(target_width, target_height) for _, target_width, target_height in specs]
+        )
+
+        variants: list[ExportVariant] = []
+        for (prefix, _, _), variant_img in zip(specs, variant_images):
             variants.append(
                 ExportVariant(
                     prefix=prefix,
@@ -1982,6 +2007,8 @@ class MainWindow(QMainWindow):
             self._show_error(str(exc))
             return None
 
+        # Variants may overwrite files of the gallery folder without changing its mtime
+        self.gallery_grid.invalidate()
         return paths
 
     def _save_simple(self) -> None:
@@ -2034,6 +2061,8 @@ class MainWindow(QMainWindow):
                 save_kwargs = {"compress_level": 6}
 
             image_to_save.save(target_path, **save_kwargs)
+            # Overwriting keeps the folder mtime; the gallery must still pick up the new thumbnail
+            self.gallery_grid.invalidate()
 
             self.metadata_dirty = False
             self.status_bar.showMessage(f"Gespeichert: {target_path.name}", 5000)
@@ -2150,7 +2179,7 @@ class MainWindow(QMainWindow):
             )
             self._append_status(f"✓ Skalierung abgeschlossen: {output_image.width}x{output_image.height}")
         else:
-            output_image = source_image.copy()
+            output_image = source_image
             self._append_status("Keine Skalierung nötig, verwende Original-Auflösung")
 
         # Save with correct format
@@ -2176,6 +2205,7 @@ class MainWindow(QMainWindow):
 
             self._append_status(f"Speichere Datei: {result.path}")
             output_image.save(result.path, **save_kwargs)
+            self.gallery_grid.invalidate()
             self._append_status(f"✓ Datei erfolgreich gespeichert: {result.path}")
             self.status_bar.showMessage(f"Gespeichert: {result.path.name}", 7000)
 
@@ -2218,12 +2248,8 @@ class MainWindow(QMainWindow):
         """Return sorted list of image files in directory."""
         if not directory or not directory.exists():
             return []
-        image_files: list[Path] = []
-        for ext in SUPPORTED_EXTENSIONS:
-            image_files.extend(directory.glob(f"*{ext}"))
-            image_files.extend(directory.glob(f"*{ext.upper()}"))
-        image_files = sorted(set(image_files), key=lambda p: p.name.lower())
-        return image_files
+        image_files = scan_image_files(directory, SUPPORTED_EXTENSIONS)
+        return sorted(image_files, key=lambda p: p.name.lower())
 
     def _update_navigation_buttons(self) -> None:
         """Update navigation button states based on available sibling images."""
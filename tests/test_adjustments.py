@@ -0,0 +1,161 @@
+import unittest
+
+import numpy as np
+from PIL import Image, ImageEnhance
+
+from src.core import adjustments
+from src.core.adjustments import (
+    AdjustmentState,
+    apply_adjustments,
+    calculate_auto_balance_color_only,
+    calculate_auto_balance_conservative,
+    calculate_auto_balance_photoshop_style,
+)
+
+
+def _gradient_image(size=(64, 48)) -> Image.Image:
+    width, height = size
+    x = np.linspace(40, 200, width, dtype=np.float32)
+    y = np.linspace(60, 180, height, dtype=np.float32)
+    arr = np.stack(
+        [
+            np.broadcast_to(x[None, :], (height, width)),
+            np.broadcast_to(y[:, None], (height, width)),
+            np.full((height, width), 120, dtype=np.float32),
+        ],
+        axis=-1,
+    )
+    return Image.fromarray(arr.astype(np.uint8), "RGB")
+
+
+class ApplyAdjustmentsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.image = _gradient_image()
+
+    def _max_diff(self, a: Image.Image, b: Image.Image) -> int:
+        return int(np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16)).max())
+
+    def test_identity_state_returns_rgb_source_unchanged(self) -> None:
+        self.assertIs(apply_adjustments(self.image, AdjustmentState()), self.image)
+
+    def test_identity_state_converts_non_rgb_source(self) -> None:
+        result = apply_adjustments(self.image.convert("RGBA"), AdjustmentState())
+        self.assertEqual(result.mode, "RGB")
+        self.assertEqual(self._max_diff(result, self.image), 0)
+
+    def test_fused_tone_matches_image_enhance(self) -> None:
+        state = AdjustmentState(brightness=1.1, contrast=0.9, saturation=1.2)
+        expected = ImageEnhance.Brightness(self.image).enhance(state.brightness)
+        expected = ImageEnhance.Contrast(expected).enhance(state.contrast)
+        expected = ImageEnhance.Color(expected).enhance(state.saturation)
+
+        result = apply_adjustments(self.image, state)
+        self.assertLessEqual(self._max_diff(result, expected), 2)
+
+    def test_clipped_highlights_match_image_enhance_chain(self) -> None:
+        # Brightness pushes the bright end past 255: contrast must pivot on the clipped image
+        image = _gradient_image().point(lambda v: min(255, v + 50))
+        state = AdjustmentState(brightness=1.5, contrast=1.5, temperature=40, red_balance=-30)
+        expected = ImageEnhance.Brightness(image).enhance(state.brightness)
+        expected = ImageEnhance.Contrast(expected).enhance(state.contrast)
+        # Temperature and balance clip separately, as two steps
+        arr = np.asarray(expected, dtype=np.float32).copy()
+        arr[..., 0] = np.clip(arr[..., 0] * 1.16, 0, 255).astype(np.uint8)
+        arr[..., 2] = np.clip(arr[..., 2] * 0.84, 0, 255).astype(np.uint8)
+        arr[..., 0] = np.clip(arr[..., 0] * 0.88, 0, 255)
+        expected = Image.fromarray(arr.astype(np.uint8), "RGB")
+
+        result = apply_adjustments(image, state)
+        self.assertLessEqual(self._max_diff(result, expected), 1)
+
+    def test_repeated_state_returns_cached_result(self) -> None:
+        state = AdjustmentState(brightness=1.3)
+        first = apply_adjustments(self.image, state)
+        self.assertIs(apply_adjustments(self.image, AdjustmentState(brightness=1.3)), first)
+        self.assertIsNot(apply_adjustments(self.image.copy(), state), first)
+
+    def test_temperature_and_balance_scale_channels(self) -> None:
+        image = Image.new("RGB", (8, 8), (100, 100, 100))
+        state = AdjustmentState(temperature=50, green_balance=-50)
+
+        r, g, b = apply_adjustments(image, state).getpixel((0, 0))
+        self.assertAlmostEqual(r, 120, delta=1)
+        self.assertAlmostEqual(g, 80, delta=1)
+        self.assertAlmostEqual(b, 80, delta=1)
+
+
+class SaturationPathTest(unittest.TestCase):
+    @unittest.skipUnless(adjustments.HAS_NUMBA, "numba not installed")
+    def test_numba_and_cv2_paths_round_alike(self) -> None:
+        grey = Image.fromarray(np.tile(np.arange(256, dtype=np.uint8), (4, 1))).convert("RGB")
+        for image in (_gradient_image(), grey):
+            for saturation in (0.3, 2.5):
+                numba_result = adjustments._apply_saturation(image, saturation)
+                adjustments.HAS_NUMBA = False
+                try:
+                    cv2_result = adjustments._apply_saturation(image, saturation)
+                finally:
+                    adjustments.HAS_NUMBA = True
+                diff = np.asarray(numba_result, dtype=np.int16) - np.asarray(cv2_result, dtype=np.int16)
+                # Summation order may still split an exact .5 tie; anything more is a rounding mismatch
+                self.assertLessEqual(int(np.abs(diff).max()), 1)
+                self.assertLess(float(np.mean(diff != 0)), 0.001)
+
+        # Grey stays grey: v * (row sum ~= 1) must not truncate to v - 1
+        self.assertEqual(np.asarray(adjustments._apply_saturation(grey, 2.5)).tolist(), np.asarray(grey).tolist())
+
+    @unittest.skipUnless(adjustments.HAS_NUMBA, "numba not installed")
+    def test_kernel_failure_falls_back_to_cv2(self) -> None:
+        def broken_kernel(*args):
+            raise RuntimeError("compile failed")
+
+        image = _gradient_image()
+        expected = adjustments._apply_saturation(image, 1.8)
+        kernel = adjustments._affine_kernel
+        adjustments._affine_kernel = broken_kernel
+        try:
+            result = adjustments._apply_saturation(image, 1.8)
+            self.assertTrue(adjustments._numba_failed)
+        finally:
+            adjustments._affine_kernel = kernel
+            adjustments._numba_failed = False
+        diff = np.asarray(result, dtype=np.int16) - np.asarray(expected, dtype=np.int16)
+        self.assertLessEqual(int(np.abs(diff).max()), 1)
+
+
+class AutoBalanceTest(unittest.TestCase):
+    def test_compressed_histogram_gets_contrast_boost(self) -> None:
+        image = _gradient_image((128, 96)).point(lambda v: 100 + v // 4)
+
+        self.assertGreater(calculate_auto_balance_photoshop_style(image).contrast, 1.0)
+        self.assertGreater(calculate_auto_balance_conservative(image).contrast, 1.0)
+
+    def test_photoshop_style_neutralizes_red_cast(self) -> None:
+        image = Image.new("RGB", (64, 64), (180, 120, 120))
+
+        state = calculate_auto_balance_photoshop_style(image)
+        self.assertLess(state.red_balance, 0)
+        self.assertGreater(state.blue_balance, 0)
+
+    def test_color_only_leaves_neutral_image_alone(self) -> None:
+        image = Image.new("RGB", (64, 64), (128, 128, 128))
+
+        state = calculate_auto_balance_color_only(image)
+        self.assertEqual((state.red_balance, state.green_balance, state.blue_balance), (0, 0, 0))
+
+    def test_color_only_medians_match_full_frame_np_median(self) -> None:
+        rng = np.random.default_rng(0)
+        arr = (rng.integers(0, 256, (63, 90, 3)) * [1.0, 0.8, 0.6]).astype(np.uint8)
+        for channel in range(3):
+            counts = np.bincount(arr[..., channel].ravel(), minlength=256)
+            self.assertEqual(adjustments._histogram_median(counts), np.median(arr[..., channel]))
+
+        # Odd count: the middle value itself, no averaging
+        self.assertEqual(adjustments._histogram_median(np.bincount([3, 3, 9], minlength=256)), 3.0)
+        noise = Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        state = calculate_auto_balance_color_only(noise)
+        self.assertTrue(all(abs(v) <= 2 for v in (state.red_balance, state.green_balance, state.blue_balance)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,6 +42,13 @@ class ExportServiceTests(unittest.TestCase):
         for name in expected:
             self.assertTrue((self.tmp_dir / name).exists())
 
+    def test_export_returns_paths_in_variant_order(self) -> None:
+        paths = self.service.export_variants(self.base_path, self.variants)
+        self.assertEqual(
+            [p.name for p in paths],
+            ["__sample_1200x600_16x9.webp", "_sample_960x480_16x9.webp", "sample_480x240_16x9.webp"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,42 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.image_files import scan_image_files, scan_image_stats  # noqa: E402
+
+
+class ScanImageFilesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_matches_extensions_case_insensitively(self) -> None:
+        for name in ("a.jpg", "b.JPG", "c.Png", "notes.txt", "noext"):
+            (self.directory / name).write_bytes(b"")
+
+        names = sorted(p.name for p in scan_image_files(self.directory, frozenset({".jpg", ".png"})))
+        self.assertEqual(names, ["a.jpg", "b.JPG", "c.Png"])
+
+    def test_skips_directories_with_image_suffix(self) -> None:
+        (self.directory / "album.jpg").mkdir()
+        (self.directory / "photo.jpg").write_bytes(b"")
+
+        result = scan_image_files(self.directory, frozenset({".jpg"}))
+        self.assertEqual(result, [self.directory / "photo.jpg"])
+
+    def test_stats_carry_file_size(self) -> None:
+        (self.directory / "photo.png").write_bytes(b"x" * 42)
+        (self.directory / "notes.txt").write_bytes(b"")
+
+        result = scan_image_stats(self.directory, frozenset({".png"}))
+        self.assertEqual([(path, info.st_size) for path, info in result], [(self.directory / "photo.png", 42)])
+
+
+if __name__ == "__main__":
+    unittest.main()
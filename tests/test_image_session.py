@@ -1,8 +1,12 @@
 import unittest
 
+import tempfile
+from pathlib import Path
+
 from PIL import Image
 
-from src.core.image_session import ImageSession
+from src.core.adjustments import AdjustmentState
+from src.core.image_session import PREVIEW_MAX_EDGE, ImageSession
 from src.core.settings import load_settings
 
 
@@ -60,6 +64,46 @@ class ImageSessionTest(unittest.TestCase):
             ],
         )
 
+    def test_rule_cache_follows_replaced_settings(self) -> None:
+        image = self._dummy_image((1500, 1000))
+        self.session.set_ratio("3:2", 3 / 2, None)
+        self.session.build_variant_specs(image)
+
+        replacement = load_settings()
+        replacement.export.variant_rules["3:2"] = replacement.export.variant_rules["default"][:1]
+        self.session.settings = replacement
+
+        specs, _ = self.session.build_variant_specs(image)
+        self.assertEqual(specs, [("__", 1500, 1000)])
+
+    def test_load_applies_exif_orientation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rotated.jpg"
+            exif = Image.Exif()
+            exif[0x0112] = 6  # rotate 90° clockwise on display
+            self._dummy_image((300, 200)).save(path, "JPEG", exif=exif)
+
+            image = self.session.load(path)
+            self.assertEqual(image.size, (200, 300))
+            self.assertEqual(image.mode, "RGB")
+
+    def test_preview_base_is_downscaled_and_cached(self) -> None:
+        self.session.set_base_image(self._dummy_image((PREVIEW_MAX_EDGE * 2, PREVIEW_MAX_EDGE)))
+
+        preview = self.session.preview_base()
+        self.assertEqual(preview.size, (PREVIEW_MAX_EDGE, PREVIEW_MAX_EDGE // 2))
+        self.assertIs(self.session.preview_base(), preview)
+
+        adjusted = self.session.apply_adjustments_preview(AdjustmentState(brightness=1.2))
+        self.assertEqual(adjusted.size, preview.size)
+
+    def test_preview_base_refreshes_when_base_changes(self) -> None:
+        self.session.set_base_image(self._dummy_image((400, 300)))
+        first = self.session.preview_base()
+        self.session.set_base_image(self._dummy_image((200, 100)))
+        self.assertIsNot(self.session.preview_base(), first)
+        self.assertEqual(self.session.preview_base().size, (200, 100))
+
 
 if __name__ == "__main__":
     unittest.main()
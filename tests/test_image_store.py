@@ -4,7 +4,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from core.image_store import ImageStore, ImageState  # noqa: E402
+from core.image_store import HISTORY_LIMIT, ImageStore, ImageState  # noqa: E402
 
 
 class ImageStoreTests(unittest.TestCase):
@@ -30,6 +30,13 @@ class ImageStoreTests(unittest.TestCase):
         self.assertFalse(self.store.undo_stack)
         self.assertFalse(self.store.redo_stack)
 
+    def test_history_drops_oldest_states_beyond_limit(self) -> None:
+        for step in range(HISTORY_LIMIT + 5):
+            self.store.push_state(ImageState(path=self.path, description=f"Step {step}"))
+
+        self.assertEqual(len(self.store.undo_stack), HISTORY_LIMIT)
+        self.assertEqual(self.store.undo_stack[0].description, "Step 4")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PySide6.QtCore import QEventLoop, QPointF, QRectF, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from ui.components.magnifier_widget import MAGNIFIER_FRAME_MS, FrameThrottle, MagnifierWidget  # noqa: E402
+
+
+class _CountingMagnifier(MagnifierWidget):
+    paints = 0
+
+    def paintEvent(self, event) -> None:
+        self.paints += 1
+        super().paintEvent(event)
+
+
+class MagnifierWidgetTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        self.parent = QWidget()
+        self.parent.resize(800, 600)
+        self.parent.show()
+        self.magnifier = _CountingMagnifier(self.parent, size=50)
+        # Left half red, right half blue
+        self.image = Image.new("RGB", (400, 300), (255, 0, 0))
+        self.image.paste((0, 0, 255), (200, 0, 400, 300))
+        self.image_rect = QRectF(0, 0, 400, 300)
+
+    def tearDown(self) -> None:
+        self.parent.close()
+        self.parent.deleteLater()
+
+    def _hover(self, x: float) -> None:
+        # _apply is the per-frame refresh; update_magnifier only adds throttling on top
+        self.magnifier._apply(QPointF(x, 150), self.image, self.image_rect, 1.0, (800, 600))
+        self.app.processEvents()
+
+    def test_new_crop_repaints_widget(self) -> None:
+        self._hover(50)
+        self.assertEqual(self.magnifier.grab().toImage().pixelColor(25, 25).red(), 255)
+
+        # grab() paints on its own; count only what the second hover schedules
+        paints = self.magnifier.paints
+        self._hover(350)
+        self.assertGreater(self.magnifier.paints, paints)
+        self.assertEqual(self.magnifier.grab().toImage().pixelColor(25, 25).blue(), 255)
+
+    def test_subpixel_move_keeps_crop(self) -> None:
+        self._hover(50)
+        serial = self.magnifier._source.crop_serial
+        self._hover(50.4)
+        self.assertEqual(self.magnifier._source.crop_serial, serial)
+
+
+class FrameThrottleTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        self.owner = QWidget()
+        self.calls: list[int] = []
+        self.throttle = FrameThrottle(self.calls.append, self.owner)
+
+    def tearDown(self) -> None:
+        self.owner.deleteLater()
+
+    def _wait_frames(self, frames: int) -> None:
+        loop = QEventLoop()
+        QTimer.singleShot(MAGNIFIER_FRAME_MS * frames, loop.quit)
+        loop.exec()
+
+    def test_first_request_runs_at_once_and_latest_pending_runs_after_the_frame(self) -> None:
+        for value in (1, 2, 3):
+            self.throttle.request(value)
+        self.assertEqual(self.calls, [1])
+
+        self._wait_frames(3)
+        self.assertEqual(self.calls, [1, 3])
+
+    def test_cancel_drops_pending_request(self) -> None:
+        self.throttle.request(1)
+        self.throttle.request(2)
+        self.throttle.cancel()
+        self._wait_frames(3)
+        self.assertEqual(self.calls, [1])
+
+        self.throttle.request(4)
+        self.assertEqual(self.calls, [1, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,12 @@ import sys
 import unittest
 from pathlib import Path
 
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageFilter
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from core import image_processing  # noqa: E402
 from core.image_processing import ProcessingPipeline  # noqa: E402
 
 
@@ -24,11 +26,109 @@ class ProcessingPipelineTests(unittest.TestCase):
         self.assertEqual(result.width, 100)
         self.assertTrue(abs(result.height - 50) <= 1)
 
+    def test_resize_to_source_size_returns_new_sharpened_image(self) -> None:
+        result = self.pipeline.resize_with_quality(self.image, target_width=200, target_height=100)
+        self.assertIsNot(result, self.image)
+        self.assertEqual(result.size, self.image.size)
+
     def test_generate_variants_returns_requested_widths(self) -> None:
         variants = self.pipeline.generate_variants(self.image, [150, 75])
         widths = {variant.width for variant in variants}
         self.assertEqual(widths, {150, 75})
 
+    def test_generate_variants_keeps_order_on_large_source(self) -> None:
+        image = Image.new("RGB", (1600, 800), (90, 140, 60))
+        variants = self.pipeline.generate_variants(image, [400, 1200, 800])
+        self.assertEqual([variant.label for variant in variants], ["400px", "1200px", "800px"])
+        self.assertEqual([variant.height for variant in variants], [200, 600, 400])
+
+    def test_resize_ladder_keeps_requested_order(self) -> None:
+        sizes = [(50, 25), (200, 100), (100, 50)]
+        results = self.pipeline.resize_ladder(self.image, sizes)
+        self.assertEqual([img.size for img in results], sizes)
+        self.assertIsNot(results[1], self.image)
+
+    def test_sharpen_matches_pil_unsharp_mask(self) -> None:
+        for size in ((200, 100), (400, 200)):
+            with self.subTest(size=size):
+                self._assert_sharpen_matches_pil(Image.linear_gradient("L").resize(size).convert("RGB"))
+
+    def test_sharpen_stays_close_to_pil_on_textured_content(self) -> None:
+        # cv2's true Gaussian differs from Pillow's box-approximated blur; on smoothed noise single
+        # pixels land up to ~6 levels apart, the mean stays well below one level.
+        noise = np.random.default_rng(0).integers(0, 256, (75, 100, 3), dtype=np.uint8)
+        image = Image.fromarray(noise).resize((400, 300), Image.Resampling.BICUBIC)
+        config = self.pipeline.config
+        expected = np.asarray(
+            image.filter(
+                ImageFilter.UnsharpMask(
+                    radius=config.sharpen_radius,
+                    percent=config.sharpen_percent,
+                    threshold=config.sharpen_threshold,
+                )
+            ),
+            dtype=np.int16,
+        )
+        diffs = np.abs(np.asarray(self.pipeline._sharpen(image), dtype=np.int16) - expected)
+        self.assertLessEqual(diffs.max(), 8)
+        self.assertLess(diffs.mean(), 1.0)
+
+    @unittest.skipUnless(image_processing.HAS_NUMBA, "numba not installed")
+    def test_numba_and_numpy_sharpen_paths_agree(self) -> None:
+        noise = np.random.default_rng(1).integers(0, 256, (300, 400, 3), dtype=np.uint8)
+        image = Image.fromarray(noise)
+        args = (1.2, 120, 3)
+        numba_result = image_processing._unsharp_mask(image, *args)
+        self.assertEqual(numba_result.tobytes(), self._numpy_unsharp(image, *args).tobytes())
+
+    @unittest.skipUnless(image_processing.HAS_NUMBA, "numba not installed")
+    def test_sharpen_falls_back_to_numpy_when_kernel_fails(self) -> None:
+        def broken_kernel(*args):
+            raise RuntimeError("compile failed")
+
+        image = Image.fromarray(np.random.default_rng(2).integers(0, 256, (300, 400, 3), dtype=np.uint8))
+        kernel = image_processing._unsharp_kernel
+        image_processing._unsharp_kernel = broken_kernel
+        try:
+            result = image_processing._unsharp_mask(image, 1.2, 120, 3)
+            self.assertTrue(image_processing._numba_failed)
+        finally:
+            image_processing._unsharp_kernel = kernel
+            image_processing._numba_failed = False
+        self.assertEqual(result.tobytes(), self._numpy_unsharp(image, 1.2, 120, 3).tobytes())
+
+    def test_pil_sharpen_filter_follows_config_changes(self) -> None:
+        first = self.pipeline._unsharp_filter()
+        self.assertIs(self.pipeline._unsharp_filter(), first)
+
+        self.pipeline.config.sharpen_percent = 80
+        self.assertEqual(self.pipeline._unsharp_filter().percent, 80)
+
+        rgba = Image.new("RGBA", (40, 20), (10, 20, 30, 255))
+        self.assertEqual(self.pipeline._sharpen(rgba).mode, "RGBA")
+
+    def _numpy_unsharp(self, image: Image.Image, *args) -> Image.Image:
+        original = image_processing._NUMBA_SHARPEN_MIN_PIXELS
+        image_processing._NUMBA_SHARPEN_MIN_PIXELS = image.width * image.height + 1
+        try:
+            return image_processing._unsharp_mask(image, *args)
+        finally:
+            image_processing._NUMBA_SHARPEN_MIN_PIXELS = original
+
+    def _assert_sharpen_matches_pil(self, image: Image.Image) -> None:
+        config = self.pipeline.config
+        expected = image.filter(
+            ImageFilter.UnsharpMask(
+                radius=config.sharpen_radius,
+                percent=config.sharpen_percent,
+                threshold=config.sharpen_threshold,
+            )
+        )
+        result = self.pipeline._sharpen(image)
+        self.assertEqual(result.mode, "RGB")
+        diffs = [abs(a - b) for a, b in zip(result.tobytes(), expected.tobytes())]
+        self.assertLessEqual(max(diffs), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
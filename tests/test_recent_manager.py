@@ -0,0 +1,65 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.recent_manager import RecentManager
+
+
+class RecentManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.manager = RecentManager(storage_dir=self.root)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_recent_files_drops_deleted_entries(self) -> None:
+        kept = self.root / "a.png"
+        removed = self.root / "b.png"
+        kept.touch()
+        removed.touch()
+        self.manager.add_file(kept)
+        self.manager.add_file(removed)
+        removed.unlink()
+        self.manager.flush()
+
+        self.assertEqual(RecentManager(storage_dir=self.root).recent_files(), [kept.resolve()])
+
+    def test_recent_folders_are_revalidated_after_ttl(self) -> None:
+        folder = self.root / "album"
+        folder.mkdir()
+        self.manager.add_folder(folder)
+        self.assertEqual(self.manager.recent_folders(), [folder.resolve()])
+
+        folder.rmdir()
+        self.assertEqual(self.manager.recent_folders(), [folder.resolve()])
+        self.manager._folders_checked_at = float("-inf")
+        self.assertEqual(self.manager.recent_folders(), [])
+
+    def test_readding_moves_entry_to_front(self) -> None:
+        first = self.root / "a.png"
+        second = self.root / "b.png"
+        first.touch()
+        second.touch()
+        self.manager.add_file(first)
+        self.manager.add_file(second)
+        self.manager.add_file(first)
+
+        self.assertEqual(self.manager.recent_files(), [first.resolve(), second.resolve()])
+
+    def test_unchanged_lists_are_not_rewritten(self) -> None:
+        image = self.root / "a.png"
+        image.touch()
+        self.manager.add_file(image)
+        self.manager.flush()
+        storage = self.root / ".image_processor_recent.json"
+        storage.write_text("sentinel", encoding="utf-8")
+
+        self.manager.add_file(image)
+        self.manager.flush()
+        self.assertEqual(storage.read_text(encoding="utf-8"), "sentinel")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.thumbnail_cache import THUMBNAIL_SIZE, ThumbnailCache  # noqa: E402
+
+
+class ThumbnailCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.cache = ThumbnailCache(cache_dir=root / "thumbs")
+        self.source = root / "photo.jpg"
+        Image.new("RGB", (800, 600), (10, 120, 200)).save(self.source)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_png_thumbnail_carries_freedesktop_attributes(self) -> None:
+        thumb_path = self.cache.get_or_create_thumbnail(self.source)
+
+        with Image.open(thumb_path) as thumb:
+            self.assertLessEqual(max(thumb.size), THUMBNAIL_SIZE)
+            self.assertEqual(thumb.text["Thumb::URI"], f"file://{self.source.absolute()}")
+            self.assertEqual(thumb.text["Thumb::MTime"], str(int(self.source.stat().st_mtime)))
+        self.assertEqual(self.cache.get_thumbnail(self.source), thumb_path)
+
+    def test_modified_source_invalidates_thumbnail(self) -> None:
+        thumb_path = self.cache.get_or_create_thumbnail(self.source)
+        later = thumb_path.stat().st_mtime + 10
+        os.utime(self.source, (later, later))
+
+        self.assertIsNone(self.cache.get_thumbnail(self.source))
+        self.assertFalse(thumb_path.exists())
+
+    def test_failed_save_leaves_no_partial_file(self) -> None:
+        thumb_path = self.cache._cache_path(self.source)
+        original_save = Image.Image.save
+
+        def failing_save(image, fp, *args, **kwargs):
+            fp.write(b"\x89PNG partial")
+            raise OSError("disk full")
+
+        Image.Image.save = failing_save
+        try:
+            self.assertIsNone(self.cache.create_thumbnail(self.source))
+        finally:
+            Image.Image.save = original_save
+
+        self.assertFalse(thumb_path.exists())
+        self.assertEqual(list(self.cache.cache_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()